@@ -14,37 +14,160 @@ Features demonstrated:
 """
 
 import os
+import re
 import sys
-import time
-import json
-from typing import Dict, List, Optional
+import csv
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional
+from pathlib import Path
 from datetime import datetime
 
-# Add current directory to path for imports
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+# Put this directory first on the path so local modules win over installed namesakes
+_here = str(Path(__file__).resolve().parent)
+if _here not in sys.path:
+    sys.path.insert(0, _here)
 
 from working_linkedin_extractor import WorkingLinkedInExtractor, LinkedInProfile
 from database_storage import LinkedInDatabaseStorage
-from stealth_browser import create_enhanced_browser, BrowserConfig
+from stealth_browser import create_enhanced_browsers, block_resource_loading, BrowserConfig
+
+# Maximum number of profiles written per bulk database save
+SAVE_BATCH_SIZE = 1000
+
+# Column order for contact CSV exports
+EXPORT_FIELDS = (
+    "Name", "Title", "Company", "Location", "LinkedIn URL",
+    "Email Addresses", "Phone Numbers", "Websites", "Social Links",
+    "Contact Quality Score", "Contact Points Found", "Data Sources", "Extraction Date"
+)
+
+# Social platform labels keyed by registered domain
+SOCIAL_PLATFORMS = {
+    "twitter.com": "Twitter/X",
+    "x.com": "Twitter/X",
+    "facebook.com": "Facebook",
+    "instagram.com": "Instagram",
+    "github.com": "GitHub",
+    "pinterest.com": "Pinterest",
+}
+
+# Host of a raw href (scheme and subdomains optional) matched against SOCIAL_PLATFORMS in one pass
+_SOCIAL_RE = re.compile(
+    r"^(?:[a-z][a-z0-9+.-]*:)?(?://)?(?:[^/?#@]*@)?(?:[\w-]+\.)*("
+    + "|".join(re.escape(domain) for domain in SOCIAL_PLATFORMS)
+    + r")\.?(?=[:/?#]|$)",
+    re.IGNORECASE
+)
+
+# Profile fields that indicate where contact data was found, in report order
+DATA_SOURCES = (
+    ("emails", "LinkedIn Sales Navigator Contact Modal"),
+    ("phones", "LinkedIn Phone Directory"),
+    ("websites", "LinkedIn Profile Websites Section"),
+    ("social_links", "LinkedIn Social Media Links"),
+    ("about", "LinkedIn About Section"),
+)
+
+# Contact records (ProfileInfo through ContactRecord) use __slots__ so bulk runs
+# hold fixed-layout objects, not nested dicts
+@dataclass
+class ProfileInfo:
+    """Identity fields shown on a contact card"""
+    __slots__ = ("name", "title", "company", "location", "linkedin_url")
+    name: str
+    title: str
+    company: str
+    location: str
+    linkedin_url: str
+
+@dataclass
+class ContactInfo:
+    """Contact points found for a profile"""
+    __slots__ = ("emails", "phones", "websites", "social_links", "addresses")
+    emails: List[str]
+    phones: List[str]
+    websites: List[str]
+    social_links: List[str]
+    addresses: List[str]
+
+@dataclass
+class ExtractionMetadata:
+    """How and where the contact data was found"""
+    __slots__ = ("profile_type", "extraction_timestamp", "contact_points_found",
+                 "data_sources", "quality_score")
+    profile_type: str
+    extraction_timestamp: str
+    contact_points_found: int
+    data_sources: List[str]
+    quality_score: int
+
+@dataclass
+class ContactRecord:
+    """One contact extraction result"""
+    __slots__ = ("profile_info", "contact_information", "extraction_metadata", "database_id")
+    profile_info: ProfileInfo
+    contact_information: ContactInfo
+    extraction_metadata: ExtractionMetadata
+    database_id: Optional[int]
+
+def _export_row(result: ContactRecord) -> List:
+    """Flatten one contact extraction result into an EXPORT_FIELDS row"""
+    profile = result.profile_info
+    contacts = result.contact_information
+    metadata = result.extraction_metadata
+    
+    return [
+        profile.name,
+        profile.title,
+        profile.company,
+        profile.location,
+        profile.linkedin_url,
+        "; ".join(contacts.emails),
+        "; ".join(contacts.phones),
+        "; ".join(contacts.websites),
+        "; ".join(contacts.social_links),
+        metadata.quality_score,
+        metadata.contact_points_found,
+        "; ".join(metadata.data_sources),
+        metadata.extraction_timestamp
+    ]
 
 class ContactExtractionDemo:
     """Demonstrate contact extraction capabilities like Cognism"""
     
-    def __init__(self):
+    def __init__(self, verbose: bool = True):
+        self.verbose = verbose
         self.extractor = None
+        self.extractors = []
         self.storage = None
+        self._pending: List[LinkedInProfile] = []
+        
+    def initialize(self, workers: int = None, demo_mode: bool = False):
+        """Initialize the contact extraction system
         
-    def initialize(self):
-        """Initialize the contact extraction system"""
+        Args:
+            workers: Number of browsers used for bulk extraction. Defaults to
+                MAX_CONCURRENT_BROWSERS (or 1 when unset)
+            demo_mode: Show a fully rendered browser window. Otherwise browsers run
+                headless, skip images/stylesheets/fonts and return at DOMContentLoaded
+        """
         try:
             print("🚀 Initializing Contact Extraction System")
             
-            # Initialize browser (non-headless to see what's happening)
+            if workers is None:
+                workers = int(os.getenv("MAX_CONCURRENT_BROWSERS", "1"))
+            
             config = BrowserConfig()
-            config.headless = False  # Show browser for demo
+            config.headless = not demo_mode
             
-            driver = create_enhanced_browser(use_stealth=True, config=config)
-            self.extractor = WorkingLinkedInExtractor(driver)
+            # Selenium drivers are not thread-safe, so each worker gets its own browser
+            for driver in create_enhanced_browsers(max(workers, 1), use_stealth=True, config=config):
+                if not demo_mode:
+                    block_resource_loading(driver)
+                self.extractors.append(WorkingLinkedInExtractor(driver))
+            self.extractor = self.extractors[0]
             self.storage = LinkedInDatabaseStorage()
             
             print("✅ Contact extraction system ready")
@@ -54,259 +177,271 @@ class ContactExtractionDemo:
             print(f"❌ Initialization failed: {e}")
             return False
     
-    def demonstrate_contact_extraction(self, profile_url: str) -> Dict:
-        """Demonstrate comprehensive contact extraction"""
+    def demonstrate_contact_extraction(self, profile_url: str,
+                                       extractor: WorkingLinkedInExtractor = None,
+                                       defer_save: bool = False) -> Optional[ContactRecord]:
+        """Demonstrate comprehensive contact extraction
+        
+        Args:
+            profile_url: LinkedIn profile URL to extract
+            extractor: Extractor to use. Defaults to the primary extractor
+            defer_save: Queue the profile for the next batched save instead of
+                saving it immediately (no database_id is assigned)
+        """
         print(f"\n🎯 Extracting contact information from: {profile_url}")
         print("=" * 60)
         
         # Extract profile with contact information
-        profile = self.extractor.extract_profile(profile_url)
+        extractor = extractor or self.extractor
+        profile = extractor.extract_single(profile_url)
         
-        if not isinstance(profile, LinkedInProfile) or not profile.extraction_success:
+        if not profile.extraction_success:
             print("❌ Failed to extract profile")
-            return {}
+            return None
         
         # Display Cognism-like contact extraction results
-        contact_data = {
-            "profile_info": {
-                "name": profile.full_name,
-                "title": profile.role,
-                "company": profile.company,
-                "location": profile.location or profile.geography,
-                "linkedin_url": profile.linkedin_url
-            },
-            "contact_information": {
-                "emails": profile.emails,
-                "phones": profile.phones,
-                "websites": profile.websites,
-                "social_links": profile.social_links,
-                "addresses": profile.addresses
-            },
-            "extraction_metadata": {
-                "profile_type": profile.profile_type,
-                "extraction_timestamp": profile.extraction_timestamp,
-                "contact_points_found": len(profile.emails) + len(profile.phones) + len(profile.websites),
-                "data_sources": self._identify_data_sources(profile)
-            }
-        }
+        contacts = ContactInfo(
+            emails=profile.emails,
+            phones=profile.phones,
+            websites=profile.websites,
+            social_links=profile.social_links,
+            addresses=profile.addresses
+        )
+        contact_data = ContactRecord(
+            profile_info=ProfileInfo(
+                name=profile.full_name,
+                title=profile.role,
+                company=profile.company,
+                location=profile.location or profile.geography,
+                linkedin_url=profile.linkedin_url
+            ),
+            contact_information=contacts,
+            extraction_metadata=ExtractionMetadata(
+                profile_type=profile.profile_type,
+                extraction_timestamp=profile.extraction_timestamp,
+                contact_points_found=len(profile.emails) + len(profile.phones) + len(profile.websites),
+                data_sources=self._identify_data_sources(profile),
+                quality_score=self._calculate_contact_quality(contacts)
+            ),
+            database_id=None
+        )
         
         # Display results in Cognism-like format
-        self._display_cognism_style_results(contact_data)
+        if self.verbose:
+            self._display_cognism_style_results(contact_data)
         
         # Save to database
-        profile_id = self.storage.save_profile(profile)
-        contact_data["database_id"] = profile_id
+        if defer_save:
+            self._pending.append(profile)
+        else:
+            profile_id = self.storage.save_profile(profile)
+            contact_data.database_id = profile_id
         
         return contact_data
     
     def _identify_data_sources(self, profile: LinkedInProfile) -> List[str]:
         """Identify where contact data was found"""
-        sources = []
-        
-        if profile.emails:
-            sources.append("LinkedIn Sales Navigator Contact Modal")
-        if profile.phones:
-            sources.append("LinkedIn Phone Directory")
-        if profile.websites:
-            sources.append("LinkedIn Profile Websites Section")
-        if profile.social_links:
-            sources.append("LinkedIn Social Media Links")
-        if profile.about:
-            sources.append("LinkedIn About Section")
-            
+        sources = [label for field, label in DATA_SOURCES if getattr(profile, field)]
         return sources or ["LinkedIn Public Profile"]
     
-    def _display_cognism_style_results(self, contact_data: Dict):
+    def _display_cognism_style_results(self, contact_data: ContactRecord):
         """Display results in a format similar to Cognism"""
-        profile = contact_data["profile_info"]
-        contacts = contact_data["contact_information"]
-        metadata = contact_data["extraction_metadata"]
-        
-        print(f"\n👤 PROFILE INFORMATION")
-        print(f"   Name: {profile['name']}")
-        print(f"   Title: {profile['title'] or 'Not specified'}")
-        print(f"   Company: {profile['company'] or 'Not specified'}")
-        print(f"   Location: {profile['location'] or 'Not specified'}")
-        print(f"   LinkedIn: {profile['linkedin_url']}")
-        
-        print(f"\n📞 CONTACT INFORMATION")
+        profile = contact_data.profile_info
+        contacts = contact_data.contact_information
+        metadata = contact_data.extraction_metadata
+        emails, phones = contacts.emails, contacts.phones
+        websites, social_links = contacts.websites, contacts.social_links
+        lines = []
+        
+        lines.append(f"\n👤 PROFILE INFORMATION")
+        lines.append(f"   Name: {profile.name}")
+        lines.append(f"   Title: {profile.title or 'Not specified'}")
+        lines.append(f"   Company: {profile.company or 'Not specified'}")
+        lines.append(f"   Location: {profile.location or 'Not specified'}")
+        lines.append(f"   LinkedIn: {profile.linkedin_url}")
+        
+        lines.append(f"\n📞 CONTACT INFORMATION")
         
         # Email addresses
-        if contacts['emails']:
-            print(f"   📧 Email Addresses ({len(contacts['emails'])} found):")
-            for i, email in enumerate(contacts['emails'], 1):
-                print(f"      {i}. {email}")
-                print(f"         ✅ Verified: Available in LinkedIn")
+        if emails:
+            lines.append(f"   📧 Email Addresses ({len(emails)} found):")
+            for i, email in enumerate(emails, 1):
+                lines.append(f"      {i}. {email}")
+                lines.append(f"         ✅ Verified: Available in LinkedIn")
         else:
-            print(f"   📧 Email Addresses: None found in accessible sources")
+            lines.append(f"   📧 Email Addresses: None found in accessible sources")
         
         # Phone numbers
-        if contacts['phones']:
-            print(f"   📱 Phone Numbers ({len(contacts['phones'])} found):")
-            for i, phone in enumerate(contacts['phones'], 1):
-                print(f"      {i}. {phone}")
-                print(f"         ✅ Source: LinkedIn Contact Information")
+        if phones:
+            lines.append(f"   📱 Phone Numbers ({len(phones)} found):")
+            for i, phone in enumerate(phones, 1):
+                lines.append(f"      {i}. {phone}")
+                lines.append(f"         ✅ Source: LinkedIn Contact Information")
         else:
-            print(f"   📱 Phone Numbers: None found in accessible sources")
+            lines.append(f"   📱 Phone Numbers: None found in accessible sources")
         
         # Websites
-        if contacts['websites']:
-            print(f"   🌐 Websites ({len(contacts['websites'])} found):")
-            for i, website in enumerate(contacts['websites'], 1):
-                print(f"      {i}. {website}")
+        if websites:
+            lines.append(f"   🌐 Websites ({len(websites)} found):")
+            for i, website in enumerate(websites, 1):
+                lines.append(f"      {i}. {website}")
         else:
-            print(f"   🌐 Websites: None found")
+            lines.append(f"   🌐 Websites: None found")
         
         # Social media
-        if contacts['social_links']:
-            print(f"   🔗 Social Media ({len(contacts['social_links'])} found):")
-            for i, social in enumerate(contacts['social_links'], 1):
+        if social_links:
+            lines.append(f"   🔗 Social Media ({len(social_links)} found):")
+            for i, social in enumerate(social_links, 1):
                 platform = self._identify_social_platform(social)
-                print(f"      {i}. {platform}: {social}")
+                lines.append(f"      {i}. {platform}: {social}")
         else:
-            print(f"   🔗 Social Media: None found")
+            lines.append(f"   🔗 Social Media: None found")
         
-        print(f"\n📊 EXTRACTION SUMMARY")
-        print(f"   Contact Points Found: {metadata['contact_points_found']}")
-        print(f"   Profile Type: {metadata['profile_type']}")
-        print(f"   Data Sources: {', '.join(metadata['data_sources'])}")
-        print(f"   Extraction Time: {metadata['extraction_timestamp']}")
+        lines.append(f"\n📊 EXTRACTION SUMMARY")
+        lines.append(f"   Contact Points Found: {metadata.contact_points_found}")
+        lines.append(f"   Profile Type: {metadata.profile_type}")
+        lines.append(f"   Data Sources: {', '.join(metadata.data_sources)}")
+        lines.append(f"   Extraction Time: {metadata.extraction_timestamp}")
         
         # Contact quality assessment (like Cognism)
-        quality_score = self._calculate_contact_quality(contacts)
-        print(f"   Contact Quality Score: {quality_score}/10")
+        lines.append(f"   Contact Quality Score: {metadata.quality_score}/10")
         
+        # One write per card keeps output readable when workers run concurrently
+        sys.stdout.write("\n".join(lines) + "\n")
+    
     def _identify_social_platform(self, url: str) -> str:
         """Identify social media platform from URL"""
-        if 'twitter.com' in url or 'x.com' in url:
-            return 'Twitter/X'
-        elif 'facebook.com' in url:
-            return 'Facebook'
-        elif 'instagram.com' in url:
-            return 'Instagram'
-        elif 'github.com' in url:
-            return 'GitHub'
-        elif 'pinterest.com' in url:
-            return 'Pinterest'
-        else:
-            return 'Other'
+        match = _SOCIAL_RE.match(url)
+        return SOCIAL_PLATFORMS[match.group(1).lower()] if match else 'Other'
     
-    def _calculate_contact_quality(self, contacts: Dict) -> int:
+    def _calculate_contact_quality(self, contacts: ContactInfo) -> int:
         """Calculate contact quality score (0-10) like Cognism"""
-        score = 0
-        
-        # Email addresses (most valuable)
-        if contacts['emails']:
-            score += min(len(contacts['emails']) * 3, 5)  # Max 5 points for emails
-        
-        # Phone numbers (very valuable)
-        if contacts['phones']:
-            score += min(len(contacts['phones']) * 2, 3)  # Max 3 points for phones
-        
-        # Websites (moderately valuable)
-        if contacts['websites']:
-            score += min(len(contacts['websites']), 1)  # Max 1 point for websites
-        
-        # Social media (somewhat valuable)
-        if contacts['social_links']:
-            score += min(len(contacts['social_links']), 1)  # Max 1 point for social
-        
-        return min(score, 10)  # Cap at 10
+        # Per-category caps add up to exactly 10
+        return (
+            min(len(contacts.emails) * 3, 5)          # Emails: most valuable, max 5 points
+            + min(len(contacts.phones) * 2, 3)        # Phones: very valuable, max 3 points
+            + min(len(contacts.websites), 1)          # Websites: max 1 point
+            + min(len(contacts.social_links), 1)      # Social media: max 1 point
+        )
     
-    def bulk_contact_extraction_demo(self, profile_urls: List[str]) -> List[Dict]:
+    def bulk_contact_extraction_demo(self, profile_urls: List[str]) -> List[ContactRecord]:
         """Demonstrate bulk contact extraction"""
-        print(f"\n🔄 Bulk Contact Extraction - {len(profile_urls)} profiles")
+        return list(self.bulk_contact_extraction_stream(profile_urls))
+    
+    def bulk_contact_extraction_stream(self, profile_urls: List[str]) -> Iterator[ContactRecord]:
+        """Extract profiles in bulk, yielding each result as soon as it is ready
+        
+        Profiles are spread over the initialized browsers; each extractor paces
+        its own page loads, backing off only when LinkedIn starts throttling.
+        The bulk report is built from running counters, so results are not kept.
+        """
+        total = len(profile_urls)
+        workers = max(min(len(self.extractors), total), 1)
+        print(f"\n🔄 Bulk Contact Extraction - {total} profiles ({workers} browsers)")
         print("=" * 60)
         
-        results = []
+        available = queue.Queue()
+        for extractor in self.extractors[:workers]:
+            available.put(extractor)
         
-        for i, url in enumerate(profile_urls, 1):
-            print(f"\n[{i}/{len(profile_urls)}] Processing: {url}")
-            
+        def extract_one(i: int, url: str) -> Optional[ContactRecord]:
+            extractor = available.get()
             try:
-                contact_data = self.demonstrate_contact_extraction(url)
-                if contact_data:
-                    results.append(contact_data)
-                    
-                # Add delay between profiles to be respectful
-                if i < len(profile_urls):
-                    print("⏳ Waiting 3 seconds before next extraction...")
-                    time.sleep(3)
-                    
+                print(f"\n[{i}/{total}] Processing: {url}")
+                return self.demonstrate_contact_extraction(url, extractor, defer_save=True)
             except Exception as e:
                 print(f"❌ Error processing {url}: {e}")
-                continue
+                return None
+            finally:
+                available.put(extractor)
+        
+        stats = {'profiles': 0, 'with_emails': 0, 'with_phones': 0,
+                 'emails': 0, 'phones': 0, 'quality': 0}
         
-        self._generate_bulk_report(results)
-        return results
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for result in executor.map(extract_one, range(1, total + 1), profile_urls):
+                if not result:
+                    continue
+                
+                email_count = len(result.contact_information.emails)
+                phone_count = len(result.contact_information.phones)
+                stats['profiles'] += 1
+                stats['with_emails'] += bool(email_count)
+                stats['with_phones'] += bool(phone_count)
+                stats['emails'] += email_count
+                stats['phones'] += phone_count
+                stats['quality'] += result.extraction_metadata.quality_score
+                yield result
+        
+        self.flush_pending_profiles()
+        self._generate_bulk_report(stats)
     
-    def _generate_bulk_report(self, results: List[Dict]):
-        """Generate summary report for bulk extraction"""
-        if not results:
+    def flush_pending_profiles(self) -> Dict[str, int]:
+        """Save queued profiles to the database in batches"""
+        pending, self._pending = self._pending, []
+        totals = {'saved': 0, 'updated': 0, 'failed': 0}
+        
+        for start in range(0, len(pending), SAVE_BATCH_SIZE):
+            batch_results = self.storage.save_profiles_bulk(pending[start:start + SAVE_BATCH_SIZE])
+            for key, count in batch_results.items():
+                totals[key] = totals.get(key, 0) + count
+        
+        if pending:
+            print(f"💾 Database: {totals['saved']} saved, {totals['updated']} updated, {totals['failed']} failed")
+        return totals
+    
+    def _generate_bulk_report(self, stats: Dict[str, int]):
+        """Generate summary report for bulk extraction from running counters"""
+        total_profiles = stats['profiles']
+        if not total_profiles:
             print("\n❌ No successful extractions for bulk report")
             return
         
-        print(f"\n📈 BULK EXTRACTION REPORT")
-        print("=" * 40)
+        lines = []
+        lines.append(f"\n📈 BULK EXTRACTION REPORT")
+        lines.append("=" * 40)
         
-        total_profiles = len(results)
-        profiles_with_emails = sum(1 for r in results if r["contact_information"]["emails"])
-        profiles_with_phones = sum(1 for r in results if r["contact_information"]["phones"])
-        total_emails = sum(len(r["contact_information"]["emails"]) for r in results)
-        total_phones = sum(len(r["contact_information"]["phones"]) for r in results)
-        avg_quality = sum(self._calculate_contact_quality(r["contact_information"]) for r in results) / total_profiles
+        profiles_with_emails = stats['with_emails']
+        profiles_with_phones = stats['with_phones']
+        total_emails = stats['emails']
+        total_phones = stats['phones']
+        avg_quality = stats['quality'] / total_profiles
         
-        print(f"📊 STATISTICS:")
-        print(f"   Total Profiles Processed: {total_profiles}")
-        print(f"   Profiles with Emails: {profiles_with_emails} ({profiles_with_emails/total_profiles*100:.1f}%)")
-        print(f"   Profiles with Phones: {profiles_with_phones} ({profiles_with_phones/total_profiles*100:.1f}%)")
-        print(f"   Total Email Addresses: {total_emails}")
-        print(f"   Total Phone Numbers: {total_phones}")
-        print(f"   Average Contact Quality: {avg_quality:.1f}/10")
+        lines.append(f"📊 STATISTICS:")
+        lines.append(f"   Total Profiles Processed: {total_profiles}")
+        lines.append(f"   Profiles with Emails: {profiles_with_emails} ({profiles_with_emails/total_profiles*100:.1f}%)")
+        lines.append(f"   Profiles with Phones: {profiles_with_phones} ({profiles_with_phones/total_profiles*100:.1f}%)")
+        lines.append(f"   Total Email Addresses: {total_emails}")
+        lines.append(f"   Total Phone Numbers: {total_phones}")
+        lines.append(f"   Average Contact Quality: {avg_quality:.1f}/10")
         
         contact_discovery_rate = (profiles_with_emails + profiles_with_phones) / total_profiles * 100
-        print(f"   Contact Discovery Rate: {contact_discovery_rate:.1f}%")
+        lines.append(f"   Contact Discovery Rate: {contact_discovery_rate:.1f}%")
+        
+        lines.append(f"\n🎯 COGNISM COMPARISON:")
+        lines.append(f"   Our Contact Discovery: {contact_discovery_rate:.1f}%")
+        lines.append(f"   Typical Cognism Rate: 70-80%")
+        lines.append(f"   Our Performance: {'✅ Competitive' if contact_discovery_rate >= 60 else '⚠️ Below Average'}")
         
-        print(f"\n🎯 COGNISM COMPARISON:")
-        print(f"   Our Contact Discovery: {contact_discovery_rate:.1f}%")
-        print(f"   Typical Cognism Rate: 70-80%")
-        print(f"   Our Performance: {'✅ Competitive' if contact_discovery_rate >= 60 else '⚠️ Below Average'}")
+        sys.stdout.write("\n".join(lines) + "\n")
     
-    def export_contact_data(self, results: List[Dict], filename: str = None) -> str:
-        """Export contact data to CSV (like Cognism export)"""
+    def export_contact_data(self, results: Iterable[ContactRecord], filename: str = None) -> str:
+        """Export contact data to CSV (like Cognism export)
+        
+        Results may be a list or a stream such as bulk_contact_extraction_stream();
+        streamed rows are written as each profile finishes.
+        """
         try:
-            import pandas as pd
-            
             if not filename:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 filename = f"contact_extraction_export_{timestamp}.csv"
             
-            # Flatten data for CSV export
-            export_data = []
-            
-            for result in results:
-                profile = result["profile_info"]
-                contacts = result["contact_information"]
-                metadata = result["extraction_metadata"]
+            # Flatten and write one row per result
+            with open(filename, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(EXPORT_FIELDS)
                 
-                export_data.append({
-                    "Name": profile["name"],
-                    "Title": profile["title"],
-                    "Company": profile["company"],
-                    "Location": profile["location"],
-                    "LinkedIn URL": profile["linkedin_url"],
-                    "Email Addresses": "; ".join(contacts["emails"]),
-                    "Phone Numbers": "; ".join(contacts["phones"]),
-                    "Websites": "; ".join(contacts["websites"]),
-                    "Social Links": "; ".join(contacts["social_links"]),
-                    "Contact Quality Score": self._calculate_contact_quality(contacts),
-                    "Contact Points Found": metadata["contact_points_found"],
-                    "Data Sources": "; ".join(metadata["data_sources"]),
-                    "Extraction Date": metadata["extraction_timestamp"]
-                })
-            
-            df = pd.DataFrame(export_data)
-            df.to_csv(filename, index=False)
+                writer.writerows(_export_row(result) for result in results)
             
             print(f"✅ Contact data exported to: {filename}")
             return filename
@@ -318,8 +453,18 @@ class ContactExtractionDemo:
     def cleanup(self):
         """Cleanup resources"""
         try:
-            if self.extractor and hasattr(self.extractor, 'driver'):
-                self.extractor.driver.quit()
+            if self._pending:
+                self.flush_pending_profiles()
+        except Exception as e:
+            print(f"⚠️ Could not save pending profiles: {e}")
+        
+        if self.storage:
+            self.storage.close()
+        
+        try:
+            for extractor in self.extractors:
+                extractor.driver.quit()
+            if self.extractors:
                 print("✅ Browser cleanup completed")
         except Exception as e:
             print(f"⚠️ Cleanup warning: {e}")
@@ -333,8 +478,8 @@ def main():
     demo = ContactExtractionDemo()
     
     try:
-        # Initialize the system
-        if not demo.initialize():
+        # Initialize the system (visible browser so the demo can be followed)
+        if not demo.initialize(demo_mode=True):
             print("❌ Failed to initialize contact extraction system")
             return
         
@@ -352,13 +497,10 @@ def main():
         print(f"\n🔍 SINGLE PROFILE DEMONSTRATION")
         contact_data = demo.demonstrate_contact_extraction(demo_profiles[0])
         
-        # Bulk extraction demonstration
+        # Bulk extraction demonstration, exporting each profile as it completes
         print(f"\n🔄 BULK EXTRACTION DEMONSTRATION")
-        all_results = demo.bulk_contact_extraction_demo(demo_profiles)
-        
-        # Export results
-        if all_results:
-            export_file = demo.export_contact_data(all_results)
+        export_file = demo.export_contact_data(demo.bulk_contact_extraction_stream(demo_profiles))
+        if export_file:
             print(f"\n💾 Results exported to: {export_file}")
         
         print(f"\n🎉 Contact extraction demo completed successfully!")
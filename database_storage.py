@@ -6,25 +6,286 @@ Handles storage of extracted LinkedIn profiles to PostgreSQL database
 Integrates with existing microservices architecture and maintains data consistency
 """
 
+from __future__ import annotations
+
 import os
+import re
+import io
+import csv
 import json
+import time
+import queue
+import atexit
 import logging
-from typing import Dict, List, Optional, Union
+import threading
+import weakref
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
 from datetime import datetime
-import pandas as pd
 from dataclasses import asdict
 import psycopg2
+from psycopg2 import sql
 from psycopg2.extras import RealDictCursor, execute_values
+from psycopg2.pool import ThreadedConnectionPool
 from contextlib import contextmanager
+from functools import lru_cache
+from itertools import chain
 from dotenv import load_dotenv
 
-from working_linkedin_extractor import LinkedInProfile
+if TYPE_CHECKING:
+    # Only needed for annotations; importing it pulls in selenium
+    from working_linkedin_extractor import LinkedInProfile
 
 # Load environment variables
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Rows per statement for execute_values batches
+BULK_PAGE_SIZE = 1000
+
+# Extraction log rows are written in batches of up to LOG_BATCH_SIZE, at most
+# LOG_FLUSH_INTERVAL seconds after the first queued row
+LOG_BATCH_SIZE = 500
+LOG_FLUSH_INTERVAL = 2.0
+
+# The log writer thread exits after LOG_WRITER_IDLE_TIMEOUT seconds without rows
+# (log_extraction starts it again), so it never keeps an unused storage alive
+LOG_WRITER_IDLE_TIMEOUT = 10.0
+
+# Queued by flush_logs() to make the log writer stop batching and write immediately,
+# and by close() to make it write what is queued and exit
+_FLUSH = object()
+_STOP = object()
+
+# Storages not yet garbage collected, closed at exit so queued logs get written;
+# held weakly so short-lived storages are not kept alive until the process ends
+_open_storages = weakref.WeakSet()
+
+def _close_open_storages():
+    """Close every storage still alive when the interpreter exits"""
+    for storage in list(_open_storages):
+        storage.close()
+
+atexit.register(_close_open_storages)
+
+# Social link host -> contact_platform value (x.com is stored as twitter); only
+# the host is matched (scheme, userinfo and subdomains optional), not the path
+_PLATFORM_RE = re.compile(
+    r'^(?:[a-z][a-z0-9+.-]*:)?(?://)?(?:[^/?#@]*@)?(?:[\w-]+\.)*'
+    r'(twitter|x|facebook|instagram|linkedin|github|youtube|tiktok|medium)\.com\.?(?=[:/?#]|$)',
+    re.IGNORECASE
+)
+_PLATFORM_ALIASES = {'x': 'twitter'}
+
+def _social_platform(url: str) -> Optional[str]:
+    """Platform name for a social link, or None if it is not a known platform"""
+    match = _PLATFORM_RE.match(url)
+    if not match:
+        return None
+    platform = match.group(1).lower()
+    return _PLATFORM_ALIASES.get(platform, platform)
+
+_COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+def _copy_field(value) -> str:
+    """Format a value for COPY's text format, where \\N is NULL"""
+    if value is None:
+        return '\\N'
+    return str(value).translate(_COPY_ESCAPES)
+
+# Filter for profiles (aliased p) with at least one email or phone
+HAS_CONTACT_INFO_SQL = """EXISTS (
+    SELECT 1 FROM linkedin_contact_info ci
+    WHERE ci.profile_id = p.id AND ci.contact_type IN ('email', 'phone')
+)"""
+
+# Schema DDL; every statement is idempotent so it can run on each startup
+PROFILES_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS linkedin_profiles (
+    id SERIAL PRIMARY KEY,
+    
+    -- Core identifiers
+    full_name TEXT NOT NULL,
+    linkedin_url TEXT UNIQUE NOT NULL,
+    
+    -- Profile information
+    role TEXT,
+    company TEXT,
+    company_linkedin_url TEXT,
+    geography TEXT,
+    location TEXT,
+    headline TEXT,
+    about TEXT,
+    
+    -- Sales Navigator specific
+    date_added TEXT,
+    
+    -- Network metrics
+    connections_count INTEGER,
+    
+    -- Profile metadata
+    profile_type TEXT DEFAULT 'unknown',
+    extraction_success BOOLEAN DEFAULT FALSE,
+    extraction_timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    
+    -- Audit fields
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Create indexes for better performance
+CREATE INDEX IF NOT EXISTS idx_linkedin_profiles_name ON linkedin_profiles(full_name);
+CREATE INDEX IF NOT EXISTS idx_linkedin_profiles_company ON linkedin_profiles(company);
+CREATE INDEX IF NOT EXISTS idx_linkedin_profiles_type ON linkedin_profiles(profile_type);
+CREATE INDEX IF NOT EXISTS idx_linkedin_profiles_extraction_time ON linkedin_profiles(extraction_timestamp);
+CREATE INDEX IF NOT EXISTS idx_linkedin_profiles_created_at ON linkedin_profiles(created_at DESC);
+
+-- Contact counts are derived from linkedin_contact_info (see linkedin_profiles_with_counts)
+ALTER TABLE linkedin_profiles
+    DROP COLUMN IF EXISTS emails_count,
+    DROP COLUMN IF EXISTS phones_count,
+    DROP COLUMN IF EXISTS websites_count,
+    DROP COLUMN IF EXISTS social_links_count;
+"""
+
+CONTACT_INFO_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS linkedin_contact_info (
+    id SERIAL PRIMARY KEY,
+    profile_id INTEGER REFERENCES linkedin_profiles(id) ON DELETE CASCADE,
+    
+    -- Contact details
+    contact_type TEXT NOT NULL, -- 'email', 'phone', 'website', 'social', 'address'
+    contact_value TEXT NOT NULL,
+    contact_platform TEXT, -- For social links: 'twitter', 'facebook', etc.
+    
+    -- Verification status
+    is_verified BOOLEAN DEFAULT FALSE,
+    verification_date TIMESTAMP,
+    
+    -- Audit fields
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    
+    UNIQUE(profile_id, contact_type, contact_value)
+);
+
+CREATE INDEX IF NOT EXISTS idx_contact_info_profile ON linkedin_contact_info(profile_id);
+CREATE INDEX IF NOT EXISTS idx_contact_info_type ON linkedin_contact_info(contact_type);
+-- Serves the has_contact_info filter (HAS_CONTACT_INFO_SQL) from the index alone
+CREATE INDEX IF NOT EXISTS idx_contact_info_reachable ON linkedin_contact_info(profile_id)
+    WHERE contact_type IN ('email', 'phone');
+"""
+
+# Counts use the (profile_id, contact_type, contact_value) unique index
+PROFILE_COUNTS_VIEW_SQL = """
+CREATE OR REPLACE VIEW linkedin_profiles_with_counts AS
+SELECT p.*, c.emails_count, c.phones_count, c.websites_count, c.social_links_count
+FROM linkedin_profiles p
+CROSS JOIN LATERAL (
+    SELECT
+        COUNT(*) FILTER (WHERE contact_type = 'email') AS emails_count,
+        COUNT(*) FILTER (WHERE contact_type = 'phone') AS phones_count,
+        COUNT(*) FILTER (WHERE contact_type = 'website') AS websites_count,
+        COUNT(*) FILTER (WHERE contact_type = 'social') AS social_links_count
+    FROM linkedin_contact_info
+    WHERE profile_id = p.id
+) c;
+"""
+
+SEARCH_INDEXES_SQL = """
+-- pg_trgm may be missing or need privileges we lack; searches still work without it
+DO $$
+BEGIN
+    CREATE EXTENSION IF NOT EXISTS pg_trgm;
+    CREATE INDEX IF NOT EXISTS idx_linkedin_profiles_company_trgm ON linkedin_profiles USING gin (company gin_trgm_ops);
+    CREATE INDEX IF NOT EXISTS idx_linkedin_profiles_role_trgm ON linkedin_profiles USING gin (role gin_trgm_ops);
+EXCEPTION WHEN OTHERS THEN
+    RAISE WARNING 'Skipping trigram search indexes: %', SQLERRM;
+END $$;
+"""
+
+EXTRACTION_LOGS_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS extraction_logs (
+    id SERIAL PRIMARY KEY,
+    
+    -- Extraction details
+    extraction_type TEXT NOT NULL, -- 'profile', 'search_results', 'bulk'
+    source_url TEXT,
+    profiles_extracted INTEGER DEFAULT 0,
+    profiles_successful INTEGER DEFAULT 0,
+    profiles_failed INTEGER DEFAULT 0,
+    
+    -- Timing
+    extraction_start TIMESTAMP,
+    extraction_end TIMESTAMP,
+    duration_seconds INTEGER,
+    
+    -- Error tracking
+    error_message TEXT,
+    
+    -- Audit
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_extraction_logs_type ON extraction_logs(extraction_type);
+CREATE INDEX IF NOT EXISTS idx_extraction_logs_date ON extraction_logs(created_at);
+"""
+
+# Older installs used VARCHAR(n); TEXT is stored the same and skips the length check.
+# The counts view pins the column types, so it is dropped here and recreated after.
+TEXT_COLUMNS_MIGRATION_SQL = """
+DO $$
+DECLARE
+    col record;
+BEGIN
+    FOR col IN
+        SELECT table_name, column_name FROM information_schema.columns
+        WHERE table_schema = current_schema()
+          AND table_name IN ('linkedin_profiles', 'linkedin_contact_info', 'extraction_logs')
+          AND data_type = 'character varying'
+    LOOP
+        DROP VIEW IF EXISTS linkedin_profiles_with_counts;
+        EXECUTE format('ALTER TABLE %I ALTER COLUMN %I TYPE TEXT', col.table_name, col.column_name);
+    END LOOP;
+END $$;
+"""
+
+# Whole schema in one round trip; the advisory lock makes concurrent workers wait
+# for the first one instead of racing on the catalog
+SCHEMA_SQL = (
+    "SELECT pg_advisory_xact_lock(hashtext('linkedin_scraper_schema'));\n"
+    + PROFILES_TABLE_SQL
+    + CONTACT_INFO_TABLE_SQL
+    + EXTRACTION_LOGS_TABLE_SQL
+    + TEXT_COLUMNS_MIGRATION_SQL
+    + PROFILE_COUNTS_VIEW_SQL
+    + SEARCH_INDEXES_SQL
+)
+
+# Shared tail of every linkedin_profiles upsert; xmax = 0 only for freshly inserted rows
+PROFILE_UPSERT_SQL = """ON CONFLICT (linkedin_url) DO UPDATE SET
+            full_name = EXCLUDED.full_name, role = EXCLUDED.role, company = EXCLUDED.company,
+            company_linkedin_url = EXCLUDED.company_linkedin_url, geography = EXCLUDED.geography,
+            location = EXCLUDED.location, headline = EXCLUDED.headline, about = EXCLUDED.about,
+            date_added = EXCLUDED.date_added, connections_count = EXCLUDED.connections_count,
+            profile_type = EXCLUDED.profile_type, extraction_success = EXCLUDED.extraction_success,
+            extraction_timestamp = EXCLUDED.extraction_timestamp, updated_at = CURRENT_TIMESTAMP
+        RETURNING id, linkedin_url, (xmax = 0) AS inserted"""
+
+# Hot single-row statements, prepared once per connection and run with EXECUTE
+PREPARED_STATEMENTS = {
+    'select_profile': "SELECT * FROM linkedin_profiles_with_counts WHERE linkedin_url = $1 LIMIT 1",
+    'upsert_profile': f"""
+        INSERT INTO linkedin_profiles (
+            full_name, linkedin_url, role, company, company_linkedin_url,
+            geography, location, headline, about, date_added, connections_count,
+            profile_type, extraction_success, extraction_timestamp
+        ) VALUES (
+            $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14
+        )
+        {PROFILE_UPSERT_SQL}
+    """,
+}
+
 class LinkedInDatabaseStorage:
     """Database storage handler for LinkedIn profiles"""
     
@@ -36,13 +297,33 @@ class LinkedInDatabaseStorage:
             'user': os.getenv('DB_USER', 'postgres'),
             'password': os.getenv('DB_PASSWORD', 'postgres')
         }
+        self.pool_size = int(os.getenv('DB_POOL_SIZE', '10'))
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        self._prepared = weakref.WeakKeyDictionary()  # connection -> prepared statement names
+        self._log_queue = queue.Queue()
+        self._log_thread = None
+        _open_storages.add(self)
         
         # Parse DATABASE_URL if provided (for cloud deployments)
         if os.getenv('DATABASE_URL'):
             self._parse_database_url()
         
-        # Ensure database and tables exist
-        self.init_database()
+        # Keepalives stop NAT/load balancers from silently dropping idle pooled
+        # connections; options given in DATABASE_URL take precedence
+        self.db_config = {
+            'connect_timeout': int(os.getenv('DB_CONNECT_TIMEOUT', '5')),
+            'keepalives': 1,
+            'keepalives_idle': 30,
+            'keepalives_interval': 10,
+            'keepalives_count': 3,
+            'sslmode': os.getenv('DB_SSLMODE', 'prefer'),
+            **self.db_config
+        }
+        
+        # Ensure database and tables exist (hot-restarted workers can skip the check)
+        if os.getenv('SKIP_DB_INIT', 'false').lower() != 'true':
+            self.init_database()
     
     def _parse_database_url(self):
         """Parse DATABASE_URL environment variable"""
@@ -54,24 +335,64 @@ class LinkedInDatabaseStorage:
             'port': url.port,
             'database': url.path[1:],  # Remove leading slash
             'user': url.username,
-            'password': url.password
+            'password': url.password,
+            # libpq options such as ?sslmode=require
+            **dict(urlparse.parse_qsl(url.query))
         }
     
+    def _get_pool(self) -> ThreadedConnectionPool:
+        """Create the connection pool on first use (up to DB_POOL_SIZE connections)"""
+        with self._pool_lock:
+            if self._pool is None or self._pool.closed:
+                self._pool = ThreadedConnectionPool(1, self.pool_size, **self.db_config)
+            return self._pool
+    
     @contextmanager
     def get_db_connection(self):
-        """Get database connection with proper error handling"""
-        conn = None
+        """Get database connection with proper error handling
+        
+        Connections are borrowed from a pool and returned open; work that was not
+        committed inside the block is rolled back so no transaction is left open.
+        """
+        pool = conn = None
         try:
-            conn = psycopg2.connect(**self.db_config)
+            pool = self._get_pool()
+            conn = pool.getconn()
             yield conn
         except Exception as e:
-            if conn:
+            if conn and not conn.closed:
                 conn.rollback()
             logger.error(f"Database error: {e}")
             raise
+        else:
+            if not conn.closed:
+                conn.rollback()
         finally:
             if conn:
-                conn.close()
+                # Connections lost mid-operation are discarded instead of reused
+                pool.putconn(conn, close=bool(conn.closed))
+    
+    def _execute_prepared(self, cursor, name: str, params: tuple):
+        """Run a PREPARED_STATEMENTS entry, preparing it on this connection first if needed"""
+        with self._pool_lock:
+            prepared = self._prepared.setdefault(cursor.connection, set())
+        
+        if name not in prepared:
+            # Prepared statements belong to the session and survive rollbacks
+            cursor.execute(f"PREPARE {name} AS {PREPARED_STATEMENTS[name]}")
+            prepared.add(name)
+        
+        placeholders = ", ".join(["%s"] * len(params))
+        cursor.execute(f"EXECUTE {name} ({placeholders})", params)
+    
+    def close(self):
+        """Write pending extraction logs and close all pooled database connections"""
+        self._stop_log_writer()
+        
+        with self._pool_lock:
+            if self._pool is not None and not self._pool.closed:
+                self._pool.closeall()
+            self._pool = None
     
     def init_database(self):
         """Initialize database and create tables if they don't exist"""
@@ -79,12 +400,12 @@ class LinkedInDatabaseStorage:
             # First, try to connect to the specified database
             with self.get_db_connection() as conn:
                 with conn.cursor() as cursor:
-                    # Create profiles table if it doesn't exist
-                    self.create_profiles_table(cursor)
-                    # Create contact_info table if it doesn't exist
-                    self.create_contact_info_table(cursor)
-                    # Create extraction_logs table
-                    self.create_extraction_logs_table(cursor)
+                    # Create tables, view and indexes that don't exist yet
+                    notices_seen = len(conn.notices)
+                    cursor.execute(SCHEMA_SQL)
+                    for notice in conn.notices[notices_seen:]:
+                        if notice.startswith("WARNING"):
+                            logger.warning(f"⚠️ {notice.split(':', 1)[-1].strip()}")
                 conn.commit()
                 logger.info("✅ Database tables initialized successfully")
         
@@ -120,262 +441,152 @@ class LinkedInDatabaseStorage:
             logger.error(f"Error creating database: {e}")
             raise
     
-    def create_profiles_table(self, cursor):
-        """Create the main profiles table"""
-        create_table_sql = \"\"\"
-        CREATE TABLE IF NOT EXISTS linkedin_profiles (
-            id SERIAL PRIMARY KEY,
-            
-            -- Core identifiers
-            full_name VARCHAR(255) NOT NULL,
-            linkedin_url VARCHAR(500) UNIQUE NOT NULL,
-            
-            -- Profile information
-            role VARCHAR(255),
-            company VARCHAR(255),
-            company_linkedin_url VARCHAR(500),
-            geography VARCHAR(255),
-            location VARCHAR(255),
-            headline TEXT,
-            about TEXT,
-            
-            -- Sales Navigator specific
-            date_added VARCHAR(100),
-            
-            -- Network metrics
-            connections_count INTEGER,
-            
-            -- Profile metadata
-            profile_type VARCHAR(50) DEFAULT 'unknown',
-            extraction_success BOOLEAN DEFAULT FALSE,
-            extraction_timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            
-            -- Data enrichment fields
-            emails_count INTEGER DEFAULT 0,
-            phones_count INTEGER DEFAULT 0,
-            websites_count INTEGER DEFAULT 0,
-            social_links_count INTEGER DEFAULT 0,
-            
-            -- Audit fields
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-        
-        -- Create indexes for better performance
-        CREATE INDEX IF NOT EXISTS idx_linkedin_profiles_name ON linkedin_profiles(full_name);
-        CREATE INDEX IF NOT EXISTS idx_linkedin_profiles_company ON linkedin_profiles(company);
-        CREATE INDEX IF NOT EXISTS idx_linkedin_profiles_type ON linkedin_profiles(profile_type);
-        CREATE INDEX IF NOT EXISTS idx_linkedin_profiles_extraction_time ON linkedin_profiles(extraction_timestamp);
-        \"\"\"
-        
-        cursor.execute(create_table_sql)
-        logger.debug("✅ Profiles table created/verified")
-    
-    def create_contact_info_table(self, cursor):
-        """Create contact information table"""
-        create_table_sql = \"\"\"
-        CREATE TABLE IF NOT EXISTS linkedin_contact_info (
-            id SERIAL PRIMARY KEY,
-            profile_id INTEGER REFERENCES linkedin_profiles(id) ON DELETE CASCADE,
-            
-            -- Contact details
-            contact_type VARCHAR(50) NOT NULL, -- 'email', 'phone', 'website', 'social', 'address'
-            contact_value VARCHAR(500) NOT NULL,
-            contact_platform VARCHAR(100), -- For social links: 'twitter', 'facebook', etc.
-            
-            -- Verification status
-            is_verified BOOLEAN DEFAULT FALSE,
-            verification_date TIMESTAMP,
-            
-            -- Audit fields
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-            
-            UNIQUE(profile_id, contact_type, contact_value)
-        );
-        
-        CREATE INDEX IF NOT EXISTS idx_contact_info_profile ON linkedin_contact_info(profile_id);
-        CREATE INDEX IF NOT EXISTS idx_contact_info_type ON linkedin_contact_info(contact_type);
-        \"\"\"
-        
-        cursor.execute(create_table_sql)
-        logger.debug("✅ Contact info table created/verified")
-    
-    def create_extraction_logs_table(self, cursor):
-        """Create extraction logs table for monitoring"""
-        create_table_sql = \"\"\"
-        CREATE TABLE IF NOT EXISTS extraction_logs (
-            id SERIAL PRIMARY KEY,
-            
-            -- Extraction details
-            extraction_type VARCHAR(50) NOT NULL, -- 'profile', 'search_results', 'bulk'
-            source_url VARCHAR(500),
-            profiles_extracted INTEGER DEFAULT 0,
-            profiles_successful INTEGER DEFAULT 0,
-            profiles_failed INTEGER DEFAULT 0,
-            
-            -- Timing
-            extraction_start TIMESTAMP,
-            extraction_end TIMESTAMP,
-            duration_seconds INTEGER,
-            
-            -- Error tracking
-            error_message TEXT,
-            
-            -- Audit
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        );
-        
-        CREATE INDEX IF NOT EXISTS idx_extraction_logs_type ON extraction_logs(extraction_type);
-        CREATE INDEX IF NOT EXISTS idx_extraction_logs_date ON extraction_logs(created_at);
-        \"\"\"
-        
-        cursor.execute(create_table_sql)
-        logger.debug("✅ Extraction logs table created/verified")
-    
     def save_profile(self, profile: LinkedInProfile) -> int:
-        \"\"\"Save a single LinkedIn profile to database\"\"\"
+        """Save a single LinkedIn profile to database"""
+        profile_id, _ = self._save_profile(profile)
+        return profile_id
+    
+    def _save_profile(self, profile: LinkedInProfile) -> Tuple[int, bool]:
+        """Save a profile, returning its id and whether a new row was inserted"""
         try:
             with self.get_db_connection() as conn:
                 with conn.cursor() as cursor:
-                    # Check if profile already exists
-                    cursor.execute(
-                        "SELECT id FROM linkedin_profiles WHERE linkedin_url = %s",
-                        (profile.linkedin_url,)
-                    )
-                    existing = cursor.fetchone()
-                    
-                    if existing:
-                        profile_id = existing[0]
-                        # Update existing profile
-                        self._update_profile(cursor, profile_id, profile)
-                        logger.info(f"✅ Updated existing profile: {profile.full_name}")
-                    else:
-                        # Insert new profile
-                        profile_id = self._insert_profile(cursor, profile)
+                    profile_id, inserted = self._upsert_profile(cursor, profile)
+                    if inserted:
                         logger.info(f"✅ Saved new profile: {profile.full_name}")
+                    else:
+                        logger.info(f"✅ Updated existing profile: {profile.full_name}")
                     
                     # Save contact information
                     self._save_contact_info(cursor, profile_id, profile)
                     
                 conn.commit()
-                return profile_id
+                return profile_id, inserted
                 
         except Exception as e:
             logger.error(f"❌ Error saving profile {profile.full_name}: {e}")
             raise
     
-    def _insert_profile(self, cursor, profile: LinkedInProfile) -> int:
-        \"\"\"Insert a new profile record\"\"\"
-        insert_sql = \"\"\"
-        INSERT INTO linkedin_profiles (
-            full_name, linkedin_url, role, company, company_linkedin_url,
-            geography, location, headline, about, date_added, connections_count,
-            profile_type, extraction_success, extraction_timestamp,
-            emails_count, phones_count, websites_count, social_links_count
-        ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-        ) RETURNING id
-        \"\"\"
-        
-        cursor.execute(insert_sql, (
+    def _upsert_profile(self, cursor, profile: LinkedInProfile) -> Tuple[int, bool]:
+        """Insert or update a profile record, returning its id and whether it was inserted"""
+        self._execute_prepared(cursor, 'upsert_profile', self._profile_row(profile))
+        profile_id, _, inserted = cursor.fetchone()
+        return profile_id, inserted
+    
+    def _profile_row(self, profile: LinkedInProfile) -> tuple:
+        """Column values for a linkedin_profiles insert, in insert column order"""
+        return (
             profile.full_name, profile.linkedin_url, profile.role, profile.company,
             profile.company_linkedin_url, profile.geography, profile.location,
             profile.headline, profile.about, profile.date_added, profile.connections_count,
-            profile.profile_type, profile.extraction_success, profile.extraction_timestamp,
-            len(profile.emails), len(profile.phones), len(profile.websites), len(profile.social_links)
-        ))
-        
-        return cursor.fetchone()[0]
-    
-    def _update_profile(self, cursor, profile_id: int, profile: LinkedInProfile):
-        \"\"\"Update existing profile record\"\"\"
-        update_sql = \"\"\"
-        UPDATE linkedin_profiles SET
-            full_name = %s, role = %s, company = %s, company_linkedin_url = %s,
-            geography = %s, location = %s, headline = %s, about = %s, date_added = %s,
-            connections_count = %s, profile_type = %s, extraction_success = %s,
-            extraction_timestamp = %s, emails_count = %s, phones_count = %s,
-            websites_count = %s, social_links_count = %s, updated_at = CURRENT_TIMESTAMP
-        WHERE id = %s
-        \"\"\"
-        
-        cursor.execute(update_sql, (
-            profile.full_name, profile.role, profile.company, profile.company_linkedin_url,
-            profile.geography, profile.location, profile.headline, profile.about,
-            profile.date_added, profile.connections_count, profile.profile_type,
-            profile.extraction_success, profile.extraction_timestamp,
-            len(profile.emails), len(profile.phones), len(profile.websites),
-            len(profile.social_links), profile_id
-        ))
+            profile.profile_type, profile.extraction_success, profile.extraction_timestamp
+        )
     
     def _save_contact_info(self, cursor, profile_id: int, profile: LinkedInProfile):
-        \"\"\"Save contact information for a profile\"\"\"
-        # Delete existing contact info for this profile
-        cursor.execute("DELETE FROM linkedin_contact_info WHERE profile_id = %s", (profile_id,))
-        
-        # Prepare contact data
-        contact_data = []
-        
-        # Add emails
-        for email in profile.emails:
-            contact_data.append((profile_id, 'email', email, None))
-        
-        # Add phones
-        for phone in profile.phones:
-            contact_data.append((profile_id, 'phone', phone, None))
-        
-        # Add websites
-        for website in profile.websites:
-            contact_data.append((profile_id, 'website', website, None))
-        
-        # Add social links
-        for social in profile.social_links:
-            platform = None
-            if 'twitter.com' in social:
-                platform = 'twitter'
-            elif 'facebook.com' in social:
-                platform = 'facebook'
-            elif 'instagram.com' in social:
-                platform = 'instagram'
-            elif 'github.com' in social:
-                platform = 'github'
-            
-            contact_data.append((profile_id, 'social', social, platform))
-        
-        # Add addresses
-        for address in profile.addresses:
-            contact_data.append((profile_id, 'address', address, None))
-        
-        # Insert contact data
-        if contact_data:
-            execute_values(
-                cursor,
-                \"\"\"INSERT INTO linkedin_contact_info 
-                   (profile_id, contact_type, contact_value, contact_platform) 
-                   VALUES %s ON CONFLICT DO NOTHING\"\"\",
-                contact_data
-            )
+        """Save contact information for a profile"""
+        self._sync_contact_rows(cursor, [profile_id], self._contact_rows(profile_id, profile))
+    
+    def _sync_contact_rows(self, cursor, profile_ids: List[int], contact_data: List[tuple]):
+        """Make the stored contacts of profile_ids match contact_data
+        
+        Rows that are already stored are left untouched, so re-saving an
+        unchanged profile writes no contact tuples.
+        """
+        if not contact_data:
+            cursor.execute("DELETE FROM linkedin_contact_info WHERE profile_id = ANY(%s)", (profile_ids,))
+            return
+        
+        # ON CONFLICT cannot touch the same row twice in a statement
+        contact_data = list({row[:3]: row for row in contact_data}.values())
+        
+        sync_sql = sql.SQL("""
+        WITH new_rows (profile_id, contact_type, contact_value, contact_platform) AS (VALUES %s),
+        upserted AS (
+            INSERT INTO linkedin_contact_info (profile_id, contact_type, contact_value, contact_platform)
+            SELECT * FROM new_rows
+            ON CONFLICT (profile_id, contact_type, contact_value) DO UPDATE
+                SET contact_platform = EXCLUDED.contact_platform
+                WHERE linkedin_contact_info.contact_platform IS DISTINCT FROM EXCLUDED.contact_platform
+        )
+        DELETE FROM linkedin_contact_info c
+        WHERE c.profile_id = ANY({profile_ids})
+          AND NOT EXISTS (
+            SELECT 1 FROM new_rows n
+            WHERE n.profile_id = c.profile_id
+              AND n.contact_type = c.contact_type
+              AND n.contact_value = c.contact_value
+          )
+        """).format(profile_ids=sql.Literal(list(profile_ids)))
+        
+        # The DELETE compares against every new row, so it must run as one statement
+        execute_values(cursor, sync_sql, contact_data, page_size=len(contact_data))
+    
+    def _contact_rows(self, profile_id: int, profile: LinkedInProfile) -> List[tuple]:
+        """Build contact info rows for a profile"""
+        return list(chain(
+            ((profile_id, 'email', email, None) for email in profile.emails),
+            ((profile_id, 'phone', phone, None) for phone in profile.phones),
+            ((profile_id, 'website', website, None) for website in profile.websites),
+            ((profile_id, 'social', social, _social_platform(social)) for social in profile.social_links),
+            ((profile_id, 'address', address, None) for address in profile.addresses),
+        ))
     
     def save_profiles_bulk(self, profiles: List[LinkedInProfile]) -> Dict[str, int]:
-        \"\"\"Save multiple profiles in bulk\"\"\"
+        """Save multiple profiles in bulk
+        
+        All profiles are upserted in one transaction. If the batch fails, each
+        profile is retried on its own so one bad row does not fail the rest.
+        """
         results = {'saved': 0, 'updated': 0, 'failed': 0}
         
+        # One row per URL: ON CONFLICT cannot update the same row twice in a statement
+        unique = list({profile.linkedin_url: profile for profile in profiles}.values())
+        if not unique:
+            return results
+        
+        upsert_sql = f"""
+        INSERT INTO linkedin_profiles (
+            full_name, linkedin_url, role, company, company_linkedin_url,
+            geography, location, headline, about, date_added, connections_count,
+            profile_type, extraction_success, extraction_timestamp
+        ) VALUES %s
+        {PROFILE_UPSERT_SQL}
+        """
+        
+        try:
+            with self.get_db_connection() as conn:
+                with conn.cursor() as cursor:
+                    returned = execute_values(
+                        cursor, upsert_sql, [self._profile_row(p) for p in unique],
+                        page_size=BULK_PAGE_SIZE, fetch=True
+                    )
+                    
+                    profile_ids = {}
+                    for profile_id, linkedin_url, inserted in returned:
+                        profile_ids[linkedin_url] = profile_id
+                        results['saved' if inserted else 'updated'] += 1
+                    
+                    # Sync contact info for every profile in the batch at once
+                    contact_data = []
+                    for profile in unique:
+                        contact_data.extend(self._contact_rows(profile_ids[profile.linkedin_url], profile))
+                    self._sync_contact_rows(cursor, list(profile_ids.values()), contact_data)
+                    
+                conn.commit()
+            
+            # Repeated URLs were saved once; later copies count as updates
+            results['updated'] += len(profiles) - len(unique)
+            logger.info(f"📊 Bulk save results: {results}")
+            return results
+            
+        except Exception as e:
+            logger.warning(f"⚠️ Batch save failed, saving profiles individually: {e}")
+            results = {'saved': 0, 'updated': 0, 'failed': 0}
+        
         for profile in profiles:
             try:
-                profile_id = self.save_profile(profile)
-                if profile_id:
-                    # Check if this was an update or new save
-                    with self.get_db_connection() as conn:
-                        with conn.cursor() as cursor:
-                            cursor.execute(
-                                "SELECT created_at, updated_at FROM linkedin_profiles WHERE id = %s",
-                                (profile_id,)
-                            )
-                            created, updated = cursor.fetchone()
-                            if created == updated:
-                                results['saved'] += 1
-                            else:
-                                results['updated'] += 1
+                _, inserted = self._save_profile(profile)
+                results['saved' if inserted else 'updated'] += 1
             except Exception as e:
                 logger.error(f"❌ Failed to save profile: {e}")
                 results['failed'] += 1
@@ -383,188 +594,334 @@ class LinkedInDatabaseStorage:
         logger.info(f"📊 Bulk save results: {results}")
         return results
     
+    def bulk_import(self, profiles: List[LinkedInProfile]) -> Dict[str, int]:
+        """Import a large batch of profiles through COPY and a staging table
+        
+        Rows are streamed with COPY into an unlogged temp table and merged into
+        linkedin_profiles with a single INSERT ... SELECT. Falls back to
+        save_profiles_bulk if the import fails.
+        """
+        results = {'saved': 0, 'updated': 0, 'failed': 0}
+        
+        # One row per URL: ON CONFLICT cannot update the same row twice in a statement
+        unique = list({profile.linkedin_url: profile for profile in profiles}.values())
+        if not unique:
+            return results
+        
+        buffer = io.StringIO()
+        for profile in unique:
+            buffer.write('\t'.join(_copy_field(value) for value in self._profile_row(profile)) + '\n')
+        buffer.seek(0)
+        
+        columns = """full_name, linkedin_url, role, company, company_linkedin_url,
+            geography, location, headline, about, date_added, connections_count,
+            profile_type, extraction_success, extraction_timestamp"""
+        merge_sql = f"""
+        INSERT INTO linkedin_profiles ({columns})
+        SELECT {columns} FROM stg_linkedin_profiles
+        {PROFILE_UPSERT_SQL}
+        """
+        
+        try:
+            with self.get_db_connection() as conn:
+                with conn.cursor() as cursor:
+                    # Temp tables skip WAL and are private to this connection
+                    cursor.execute(f"""
+                        CREATE TEMP TABLE stg_linkedin_profiles ON COMMIT DROP AS
+                        SELECT {columns} FROM linkedin_profiles WITH NO DATA
+                    """)
+                    cursor.copy_expert(f"COPY stg_linkedin_profiles ({columns}) FROM STDIN", buffer)
+                    cursor.execute(merge_sql)
+                    
+                    profile_ids = {}
+                    for profile_id, linkedin_url, inserted in cursor:
+                        profile_ids[linkedin_url] = profile_id
+                        results['saved' if inserted else 'updated'] += 1
+                    
+                    contact_data = []
+                    for profile in unique:
+                        contact_data.extend(self._contact_rows(profile_ids[profile.linkedin_url], profile))
+                    self._sync_contact_rows(cursor, list(profile_ids.values()), contact_data)
+                    
+                conn.commit()
+            
+            # Repeated URLs were saved once; later copies count as updates
+            results['updated'] += len(profiles) - len(unique)
+            logger.info(f"📊 Bulk import results: {results}")
+            return results
+            
+        except Exception as e:
+            logger.warning(f"⚠️ COPY import failed, falling back to batch save: {e}")
+            return self.save_profiles_bulk(profiles)
+    
+    def get_already_extracted_urls(self, linkedin_urls: List[str], max_age_days: int = 7) -> set:
+        """URLs among linkedin_urls that were successfully extracted within max_age_days"""
+        if not linkedin_urls:
+            return set()
+        
+        try:
+            with self.get_db_connection() as conn:
+                with conn.cursor() as cursor:
+                    # extraction_timestamp holds naive UTC times
+                    cursor.execute("""
+                        SELECT linkedin_url FROM linkedin_profiles
+                        WHERE linkedin_url = ANY(%s)
+                          AND extraction_success
+                          AND extraction_timestamp > (NOW() AT TIME ZONE 'UTC') - %s * INTERVAL '1 day'
+                    """, (list(linkedin_urls), max_age_days))
+                    return {row[0] for row in cursor}
+        except Exception as e:
+            logger.error(f"❌ Error checking extracted profiles: {e}")
+            return set()
+    
     def get_profile_by_url(self, linkedin_url: str) -> Optional[Dict]:
-        \"\"\"Get profile by LinkedIn URL\"\"\"
+        """Get profile by LinkedIn URL"""
         try:
             with self.get_db_connection() as conn:
                 with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-                    cursor.execute(
-                        "SELECT * FROM linkedin_profiles WHERE linkedin_url = %s",
-                        (linkedin_url,)
-                    )
-                    return dict(cursor.fetchone()) if cursor.fetchone() else None
+                    self._execute_prepared(cursor, 'select_profile', (linkedin_url,))
+                    row = cursor.fetchone()
+                    return dict(row) if row else None
         except Exception as e:
             logger.error(f"❌ Error fetching profile: {e}")
             return None
     
+    def _build_where_clause(self, filters: Dict) -> Tuple[str, List]:
+        """Build the WHERE clause and parameters for profile search filters"""
+        conditions = []
+        params = []
+        
+        if filters.get('company'):
+            conditions.append("company ILIKE %s")
+            params.append(f"%{filters['company']}%")
+        
+        if filters.get('role'):
+            conditions.append("role ILIKE %s")
+            params.append(f"%{filters['role']}%")
+        
+        if filters.get('location'):
+            conditions.append("(geography ILIKE %s OR location ILIKE %s)")
+            params.extend([f"%{filters['location']}%", f"%{filters['location']}%"])
+        
+        if filters.get('profile_type'):
+            conditions.append("profile_type = %s")
+            params.append(filters['profile_type'])
+        
+        if filters.get('has_contact_info'):
+            conditions.append(HAS_CONTACT_INFO_SQL)
+        
+        where_clause = "WHERE " + " AND ".join(conditions) if conditions else ""
+        return where_clause, params
+    
     def search_profiles(self, **filters) -> List[Dict]:
-        \"\"\"Search profiles with various filters\"\"\"
+        """Search profiles with various filters"""
         try:
-            conditions = []
-            params = []
-            
             # Build WHERE clause based on filters
-            if filters.get('company'):
-                conditions.append("company ILIKE %s")
-                params.append(f"%{filters['company']}%")
-            
-            if filters.get('role'):
-                conditions.append("role ILIKE %s")
-                params.append(f"%{filters['role']}%")
-            
-            if filters.get('location'):
-                conditions.append("(geography ILIKE %s OR location ILIKE %s)")
-                params.extend([f"%{filters['location']}%", f"%{filters['location']}%"])
-            
-            if filters.get('profile_type'):
-                conditions.append("profile_type = %s")
-                params.append(filters['profile_type'])
-            
-            if filters.get('has_contact_info'):
-                conditions.append("(emails_count > 0 OR phones_count > 0)")
+            where_clause, params = self._build_where_clause(filters)
             
-            # Limit results
-            limit = filters.get('limit', 100)
+            # Limit results (passed as a parameter so every limit shares one query text)
+            params.append(int(filters.get('limit', 100)))
             
-            where_clause = "WHERE " + " AND ".join(conditions) if conditions else ""
-            
-            query = f\"\"\"
-            SELECT * FROM linkedin_profiles 
+            query = f"""
+            SELECT * FROM linkedin_profiles_with_counts p
             {where_clause}
             ORDER BY created_at DESC 
-            LIMIT {limit}
-            \"\"\"
+            LIMIT %s
+            """
             
             with self.get_db_connection() as conn:
-                with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+                with conn.cursor() as cursor:
                     cursor.execute(query, params)
-                    return [dict(row) for row in cursor.fetchall()]
+                    # Plain tuples zipped with the column names; a RealDictRow per row
+                    # would only be copied into a dict again
+                    columns = [column.name for column in cursor.description]
+                    return [dict(zip(columns, row)) for row in cursor]
                     
         except Exception as e:
             logger.error(f"❌ Error searching profiles: {e}")
             return []
     
     def get_extraction_stats(self) -> Dict:
-        \"\"\"Get extraction statistics\"\"\"
+        """Get extraction statistics"""
         try:
             with self.get_db_connection() as conn:
                 with conn.cursor() as cursor:
-                    stats = {}
-                    
-                    # Total profiles
-                    cursor.execute("SELECT COUNT(*) FROM linkedin_profiles")
-                    stats['total_profiles'] = cursor.fetchone()[0]
-                    
-                    # Successful extractions
-                    cursor.execute("SELECT COUNT(*) FROM linkedin_profiles WHERE extraction_success = TRUE")
-                    stats['successful_profiles'] = cursor.fetchone()[0]
-                    
-                    # Profiles with contact info
-                    cursor.execute("SELECT COUNT(*) FROM linkedin_profiles WHERE emails_count > 0 OR phones_count > 0")
-                    stats['profiles_with_contacts'] = cursor.fetchone()[0]
+                    # All counters in one round trip and one pass over linkedin_profiles
+                    cursor.execute(f"""
+                        SELECT
+                            COUNT(*),
+                            COUNT(*) FILTER (WHERE extraction_success),
+                            COUNT(*) FILTER (WHERE {HAS_CONTACT_INFO_SQL}),
+                            (SELECT COUNT(*) FROM linkedin_contact_info),
+                            COUNT(*) FILTER (WHERE created_at > NOW() - INTERVAL '24 hours')
+                        FROM linkedin_profiles p
+                    """)
+                    (total_profiles, successful_profiles, profiles_with_contacts,
+                     total_contact_records, recent_extractions) = cursor.fetchone()
                     
-                    # Total contact info records
-                    cursor.execute("SELECT COUNT(*) FROM linkedin_contact_info")
-                    stats['total_contact_records'] = cursor.fetchone()[0]
-                    
-                    # Recent extractions (last 24 hours)
-                    cursor.execute(
-                        "SELECT COUNT(*) FROM linkedin_profiles WHERE created_at > NOW() - INTERVAL '24 hours'"
-                    )
-                    stats['recent_extractions'] = cursor.fetchone()[0]
-                    
-                    return stats
+                    return {
+                        'total_profiles': total_profiles,
+                        'successful_profiles': successful_profiles,
+                        'profiles_with_contacts': profiles_with_contacts,
+                        'total_contact_records': total_contact_records,
+                        'recent_extractions': recent_extractions
+                    }
                     
         except Exception as e:
             logger.error(f"❌ Error getting stats: {e}")
             return {}
     
     def export_to_csv(self, output_file: str = None, **filters) -> str:
-        \"\"\"Export profiles to CSV with contact information\"\"\"
+        """Export profiles to CSV with contact information
+        
+        Rows are streamed from a server-side cursor straight into the CSV file,
+        with each profile's contacts aggregated in SQL.
+        """
         try:
             # Generate filename if not provided
             if not output_file:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 output_file = f"linkedin_export_{timestamp}.csv"
             
-            # Get profiles with filters
-            profiles = self.search_profiles(**filters)
+            where_clause, params = self._build_where_clause(filters)
+            params.append(int(filters.get('limit', 100)))
+            
+            query = f"""
+            SELECT p.*,
+                COALESCE(c.emails, '') AS emails,
+                COALESCE(c.phones, '') AS phones,
+                COALESCE(c.websites, '') AS websites,
+                COALESCE(c.social_links, '') AS social_links
+            FROM linkedin_profiles_with_counts p
+            LEFT JOIN LATERAL (
+                SELECT
+                    string_agg(contact_value, ', ' ORDER BY id) FILTER (WHERE contact_type = 'email') AS emails,
+                    string_agg(contact_value, ', ' ORDER BY id) FILTER (WHERE contact_type = 'phone') AS phones,
+                    string_agg(contact_value, ', ' ORDER BY id) FILTER (WHERE contact_type = 'website') AS websites,
+                    string_agg(contact_value, ', ' ORDER BY id) FILTER (WHERE contact_type = 'social') AS social_links
+                FROM linkedin_contact_info
+                WHERE profile_id = p.id
+            ) c ON TRUE
+            {where_clause}
+            ORDER BY created_at DESC
+            LIMIT %s
+            """
             
-            if not profiles:
+            exported = 0
+            with self.get_db_connection() as conn:
+                with conn.cursor(name='linkedin_export') as cursor:
+                    cursor.itersize = BULK_PAGE_SIZE
+                    cursor.execute(query, params)
+                    
+                    with open(output_file, 'w', newline='', encoding='utf-8') as f:
+                        writer = csv.writer(f)
+                        for row in cursor:
+                            if not exported:
+                                # Named cursors only describe columns after the first fetch
+                                writer.writerow([column[0] for column in cursor.description])
+                            writer.writerow(row)
+                            exported += 1
+            
+            if not exported:
+                os.remove(output_file)
                 logger.warning("No profiles found for export")
                 return ""
             
-            # Convert to DataFrame
-            df = pd.DataFrame(profiles)
-            
-            # Add contact information
-            contact_info = []
-            for profile in profiles:
-                profile_contacts = self._get_profile_contacts(profile['id'])
-                contact_info.append(profile_contacts)
-            
-            # Add contact columns
-            df['emails'] = [', '.join(c.get('emails', [])) for c in contact_info]
-            df['phones'] = [', '.join(c.get('phones', [])) for c in contact_info]
-            df['websites'] = [', '.join(c.get('websites', [])) for c in contact_info]
-            df['social_links'] = [', '.join(c.get('social_links', [])) for c in contact_info]
-            
-            # Export to CSV
-            df.to_csv(output_file, index=False)
-            logger.info(f"✅ Exported {len(profiles)} profiles to {output_file}")
-            
+            logger.info(f"✅ Exported {exported} profiles to {output_file}")
             return output_file
             
         except Exception as e:
             logger.error(f"❌ Error exporting to CSV: {e}")
             return ""
     
-    def _get_profile_contacts(self, profile_id: int) -> Dict[str, List[str]]:
-        \"\"\"Get contact information for a profile\"\"\"
-        try:
-            with self.get_db_connection() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute(
-                        "SELECT contact_type, contact_value FROM linkedin_contact_info WHERE profile_id = %s",
-                        (profile_id,)
-                    )
-                    
-                    contacts = {'emails': [], 'phones': [], 'websites': [], 'social_links': [], 'addresses': []}
-                    
-                    for contact_type, contact_value in cursor.fetchall():
-                        if contact_type in contacts:
-                            contacts[contact_type].append(contact_value)
-                        elif contact_type == 'social':
-                            contacts['social_links'].append(contact_value)
-                    
-                    return contacts
-                    
-        except Exception as e:
-            logger.error(f"❌ Error getting contacts for profile {profile_id}: {e}")
-            return {'emails': [], 'phones': [], 'websites': [], 'social_links': [], 'addresses': []}
-    
     def log_extraction(self, extraction_type: str, source_url: str, 
                       profiles_extracted: int, profiles_successful: int, 
                       duration_seconds: int, error_message: str = None):
-        \"\"\"Log extraction activity\"\"\"
+        """Log extraction activity
+        
+        The row is queued and written in a batch by a background thread;
+        call flush_logs() to wait until it has been stored.
+        """
+        row = (
+            extraction_type, source_url, profiles_extracted, profiles_successful,
+            profiles_extracted - profiles_successful, duration_seconds, error_message
+        )
+        
+        # Queued under the lock the writer holds while deciding to exit, so a row
+        # never lands in the queue just after the writer has left it
+        with self._pool_lock:
+            self._log_queue.put(row)
+            if self._log_thread is None or not self._log_thread.is_alive():
+                self._log_thread = threading.Thread(
+                    target=self._log_writer, name="extraction-log-writer", daemon=True
+                )
+                self._log_thread.start()
+    
+    def flush_logs(self):
+        """Block until every queued extraction log row has been written"""
+        with self._pool_lock:
+            if self._log_thread is None or not self._log_thread.is_alive():
+                return
+            self._log_queue.put(_FLUSH)
+        self._log_queue.join()
+    
+    def _stop_log_writer(self):
+        """Write queued extraction logs and let the writer thread exit"""
+        with self._pool_lock:
+            log_thread = self._log_thread
+            if log_thread is None or not log_thread.is_alive():
+                return
+            self._log_queue.put(_STOP)
+        log_thread.join()
+    
+    def _log_writer(self):
+        """Background loop writing queued extraction logs in batches until idle or stopped"""
+        while True:
+            try:
+                batch = [self._log_queue.get(timeout=LOG_WRITER_IDLE_TIMEOUT)]
+            except queue.Empty:
+                with self._pool_lock:
+                    if self._log_queue.empty():
+                        self._log_thread = None
+                        return
+                continue
+            deadline = time.monotonic() + LOG_FLUSH_INTERVAL
+            
+            while batch[-1] not in (_FLUSH, _STOP) and len(batch) < LOG_BATCH_SIZE:
+                try:
+                    batch.append(self._log_queue.get(timeout=max(deadline - time.monotonic(), 0)))
+                except queue.Empty:
+                    break
+            
+            rows = [row for row in batch if row is not _FLUSH and row is not _STOP]
+            if rows:
+                self._write_extraction_logs(rows)
+            for _ in batch:
+                self._log_queue.task_done()
+            
+            if batch[-1] is _STOP:
+                with self._pool_lock:
+                    if self._log_queue.empty():
+                        self._log_thread = None
+                        return
+    
+    def _write_extraction_logs(self, rows: List[tuple]):
+        """Insert a batch of extraction log rows"""
         try:
             with self.get_db_connection() as conn:
                 with conn.cursor() as cursor:
-                    cursor.execute(\"\"\"
+                    execute_values(cursor, """
                         INSERT INTO extraction_logs 
                         (extraction_type, source_url, profiles_extracted, profiles_successful, 
                          profiles_failed, duration_seconds, error_message)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s)
-                    \"\"\", (
-                        extraction_type, source_url, profiles_extracted, profiles_successful,
-                        profiles_extracted - profiles_successful, duration_seconds, error_message
-                    ))
+                        VALUES %s
+                    """, rows, page_size=BULK_PAGE_SIZE)
                 conn.commit()
         except Exception as e:
             logger.error(f"❌ Error logging extraction: {e}")
 
     def test_connection(self) -> bool:
-        \"\"\"Test database connection\"\"\"
+        """Test database connection"""
         try:
             with self.get_db_connection() as conn:
                 with conn.cursor() as cursor:
@@ -576,17 +933,19 @@ class LinkedInDatabaseStorage:
             return False
 
 # Convenience functions for backwards compatibility
+@lru_cache(maxsize=1)
+def _default_storage() -> LinkedInDatabaseStorage:
+    """Shared storage for the helpers below, so the schema check and pool are set up once"""
+    return LinkedInDatabaseStorage()
+
 def save_linkedin_profile(profile: LinkedInProfile) -> int:
-    \"\"\"Save a single LinkedIn profile\"\"\"
-    storage = LinkedInDatabaseStorage()
-    return storage.save_profile(profile)
+    """Save a single LinkedIn profile"""
+    return _default_storage().save_profile(profile)
 
 def save_linkedin_profiles(profiles: List[LinkedInProfile]) -> Dict[str, int]:
-    \"\"\"Save multiple LinkedIn profiles\"\"\"
-    storage = LinkedInDatabaseStorage()
-    return storage.save_profiles_bulk(profiles)
+    """Save multiple LinkedIn profiles"""
+    return _default_storage().save_profiles_bulk(profiles)
 
 def export_profiles_to_csv(output_file: str = None, **filters) -> str:
-    \"\"\"Export profiles to CSV\"\"\"
-    storage = LinkedInDatabaseStorage()
-    return storage.export_to_csv(output_file, **filters)
\ No newline at end of file
+    """Export profiles to CSV"""
+    return _default_storage().export_to_csv(output_file, **filters)
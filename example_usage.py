@@ -6,48 +6,72 @@ This file contains practical examples of how to use the LinkedIn scraper
 for various common use cases.
 """
 
-import os
+import io
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
 from typing import List
+from pathlib import Path
+from datetime import datetime
 
-# Add current directory to path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+# Put this directory first on the path so local modules win over installed namesakes
+_here = str(Path(__file__).resolve().parent)
+if _here not in sys.path:
+    sys.path.insert(0, _here)
 
 from working_linkedin_extractor import WorkingLinkedInExtractor, LinkedInProfile
-from database_storage import LinkedInDatabaseStorage, export_profiles_to_csv
+from database_storage import LinkedInDatabaseStorage
 from stealth_browser import create_enhanced_browser
 
+# Browser shared by the examples while a shared_browser() context is open
+_shared = {}
+
+@contextmanager
+def shared_browser():
+    """Yield (driver, extractor, storage), starting Chrome only once
+    
+    Nested contexts reuse the same browser; it quits when the outermost exits.
+    """
+    if not _shared:
+        driver = create_enhanced_browser(use_stealth=True)
+        _shared.update(driver=driver, extractor=WorkingLinkedInExtractor(driver),
+                       storage=LinkedInDatabaseStorage(), users=0)
+    _shared['users'] += 1
+    try:
+        yield _shared['driver'], _shared['extractor'], _shared['storage']
+    finally:
+        _shared['users'] -= 1
+        if not _shared['users']:
+            driver = _shared['driver']
+            _shared.clear()
+            driver.quit()
+
 def example_1_single_profile():
     """Example 1: Extract a single LinkedIn profile"""
     print("📝 Example 1: Single Profile Extraction")
     print("=" * 50)
     
     # Initialize browser and extractor
-    driver = create_enhanced_browser(use_stealth=True)
-    extractor = WorkingLinkedInExtractor(driver)
-    storage = LinkedInDatabaseStorage()
-    
-    try:
+    with shared_browser() as (driver, extractor, storage):
         # Extract profile
         profile_url = "https://www.linkedin.com/in/williamhgates/"
-        profile = extractor.extract_profile(profile_url)
+        profile = extractor.extract_single(profile_url)
         
-        if profile and profile.extraction_success:
-            print(f"✅ Successfully extracted: {profile.full_name}")
-            print(f"   Role: {profile.role}")
-            print(f"   Company: {profile.company}")
-            print(f"   Location: {profile.location or profile.geography}")
-            print(f"   Emails: {profile.emails}")
-            print(f"   Phones: {profile.phones}")
-            
+        if profile.extraction_success:
             # Save to database
             profile_id = storage.save_profile(profile)
-            print(f"   💾 Saved to database with ID: {profile_id}")
+            
+            sys.stdout.write("\n".join([
+                f"✅ Successfully extracted: {profile.full_name}",
+                f"   Role: {profile.role}",
+                f"   Company: {profile.company}",
+                f"   Location: {profile.location or profile.geography}",
+                f"   Emails: {profile.emails}",
+                f"   Phones: {profile.phones}",
+                f"   💾 Saved to database with ID: {profile_id}",
+            ]) + "\n")
         else:
             print("❌ Failed to extract profile")
-            
-    finally:
-        driver.quit()
 
 def example_2_bulk_extraction():
     """Example 2: Bulk profile extraction from a list"""
@@ -60,90 +84,72 @@ def example_2_bulk_extraction():
         "https://www.linkedin.com/in/satyanadella/"
     ]
     
-    driver = create_enhanced_browser(use_stealth=True)
-    extractor = WorkingLinkedInExtractor(driver)
-    storage = LinkedInDatabaseStorage()
-    
-    try:
+    with shared_browser() as (driver, extractor, storage):
         extracted_profiles = []
         
+        # The extractor paces requests itself, backing off while LinkedIn throttles
         for i, url in enumerate(profile_urls, 1):
             print(f"\n[{i}/{len(profile_urls)}] Processing: {url}")
             
-            profile = extractor.extract_profile(url)
+            profile = extractor.extract_single(url)
             
-            if profile and profile.extraction_success:
+            if profile.extraction_success:
                 # Save to database
                 profile_id = storage.save_profile(profile)
                 extracted_profiles.append(profile)
                 print(f"✅ Extracted: {profile.full_name} (ID: {profile_id})")
             else:
                 print(f"❌ Failed to extract: {url}")
-            
-            # Respectful delay between requests
-            if i < len(profile_urls):
-                print("⏳ Waiting 3 seconds...")
-                import time
-                time.sleep(3)
         
-        print(f"\n📊 Bulk extraction summary:")
-        print(f"   Successfully extracted: {len(extracted_profiles)}/{len(profile_urls)}")
-        print(f"   Success rate: {len(extracted_profiles)/len(profile_urls)*100:.1f}%")
-        
-    finally:
-        driver.quit()
+        sys.stdout.write("\n".join([
+            "\n📊 Bulk extraction summary:",
+            f"   Successfully extracted: {len(extracted_profiles)}/{len(profile_urls)}",
+            f"   Success rate: {len(extracted_profiles)/len(profile_urls)*100:.1f}%",
+        ]) + "\n")
 
 def example_3_contact_extraction():
     """Example 3: Focus on contact information extraction"""
     print("\n📝 Example 3: Contact Information Extraction")
     print("=" * 50)
     
-    driver = create_enhanced_browser(use_stealth=True)
-    extractor = WorkingLinkedInExtractor(driver)
-    
-    try:
+    with shared_browser() as (driver, extractor, storage):
         # Example with a profile that might have contact information
         profile_url = "https://www.linkedin.com/in/williamhgates/"
-        profile = extractor.extract_profile(profile_url)
+        profile = extractor.extract_single(profile_url)
         
-        if profile and profile.extraction_success:
-            print(f"👤 Profile: {profile.full_name}")
-            print(f"📞 Contact Information Found:")
+        if profile.extraction_success:
+            # Collect the report and write it in one go
+            lines = [f"👤 Profile: {profile.full_name}", "📞 Contact Information Found:"]
             
             if profile.emails:
-                print(f"   📧 Email addresses ({len(profile.emails)}):")
-                for email in profile.emails:
-                    print(f"      • {email}")
+                lines.append(f"   📧 Email addresses ({len(profile.emails)}):")
+                lines.extend(f"      • {email}" for email in profile.emails)
             else:
-                print("   📧 No email addresses found")
+                lines.append("   📧 No email addresses found")
             
             if profile.phones:
-                print(f"   📱 Phone numbers ({len(profile.phones)}):")
-                for phone in profile.phones:
-                    print(f"      • {phone}")
+                lines.append(f"   📱 Phone numbers ({len(profile.phones)}):")
+                lines.extend(f"      • {phone}" for phone in profile.phones)
             else:
-                print("   📱 No phone numbers found")
+                lines.append("   📱 No phone numbers found")
             
             if profile.websites:
-                print(f"   🌐 Websites ({len(profile.websites)}):")
-                for website in profile.websites:
-                    print(f"      • {website}")
+                lines.append(f"   🌐 Websites ({len(profile.websites)}):")
+                lines.extend(f"      • {website}" for website in profile.websites)
             else:
-                print("   🌐 No websites found")
+                lines.append("   🌐 No websites found")
             
             # Calculate contact quality score
             contact_points = len(profile.emails) + len(profile.phones) + len(profile.websites)
             quality_score = min(contact_points * 2, 10)  # Simple scoring
             
-            print(f"\n📊 Contact Quality Score: {quality_score}/10")
-            print(f"   Contact points found: {contact_points}")
-            print(f"   Profile type: {profile.profile_type}")
+            lines.append(f"\n📊 Contact Quality Score: {quality_score}/10")
+            lines.append(f"   Contact points found: {contact_points}")
+            lines.append(f"   Profile type: {profile.profile_type}")
+            sys.stdout.write("\n".join(lines) + "\n")
             
         else:
             print("❌ Failed to extract profile")
-            
-    finally:
-        driver.quit()
 
 def example_4_database_operations():
     """Example 4: Database operations and exports"""
@@ -172,11 +178,12 @@ def example_4_database_operations():
     
     # Export to CSV
     print("\n💾 Exporting profiles to CSV:")
-    from datetime import datetime
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     export_file = f"example_export_{timestamp}.csv"
     
-    exported_file = export_profiles_to_csv(export_file, limit=10)
+    # Export through the storage already opened above rather than the module
+    # helper, which would set up a second pool and repeat the schema check
+    exported_file = storage.export_to_csv(export_file, limit=10)
     if exported_file:
         print(f"   ✅ Exported to: {exported_file}")
     else:
@@ -220,38 +227,61 @@ def example_6_advanced_filtering():
         ("Bay Area Profiles", {"location": "San Francisco"})
     ]
     
+    lines = []
     for description, filters in search_examples:
-        print(f"\n🔍 {description}:")
+        lines.append(f"\n🔍 {description}:")
         profiles = storage.search_profiles(**filters, limit=3)
         
         if profiles:
             for profile in profiles:
-                emails_count = profile.get('emails_count', 0)
-                phones_count = profile.get('phones_count', 0)
-                print(f"   • {profile['full_name']} - {profile['company']}")
-                print(f"     📧 {emails_count} emails, 📱 {phones_count} phones")
+                # Counts come precomputed from linkedin_profiles_with_counts
+                lines.append(f"   • {profile['full_name']} - {profile['company']}")
+                lines.append(f"     📧 {profile['emails_count']} emails, 📱 {profile['phones_count']} phones")
         else:
-            print("   No profiles found")
+            lines.append("   No profiles found")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def run_browser_examples():
+    """Run the browser-based examples with a single shared browser"""
+    with shared_browser():
+        example_1_single_profile()
+        example_2_bulk_extraction()
+        example_3_contact_extraction()
+
+def _captured_output(example) -> str:
+    """Run an example and return what it printed and logged (runs in a worker process)
+    
+    Logging is not configured here, so records reach Python's last-resort
+    handler, which writes to whatever sys.stderr is at the time.
+    """
+    buffer = io.StringIO()
+    with redirect_stdout(buffer), redirect_stderr(buffer):
+        example()
+    return buffer.getvalue()
 
 def run_all_examples():
-    """Run all examples in sequence"""
+    """Run the examples that need no browser side by side in worker processes
+    
+    Each example's output, log records included, is printed as one block in
+    example order.
+    """
     print("🎉 LinkedIn Scraper - Example Usage")
     print("=" * 70)
     print("This will demonstrate various ways to use the LinkedIn scraper")
     print("\n⚠️  Note: Some examples require actual LinkedIn login and profiles")
     
     try:
-        # Database operations (no browser needed)
-        example_4_database_operations()
-        example_6_advanced_filtering()
-        
-        # Sales Navigator info (no browser needed)
-        example_5_sales_navigator()
+        # Database operations and Sales Navigator info (no browser needed) are
+        # independent, so they run side by side; output is printed in order
+        examples = [example_4_database_operations, example_6_advanced_filtering, example_5_sales_navigator]
+        with ProcessPoolExecutor(max_workers=len(examples)) as executor:
+            for output in executor.map(_captured_output, examples):
+                sys.stdout.write(output)
         
         print("\n✅ Examples completed!")
         print("\n💡 To run browser-based examples:")
         print("   1. Ensure your .env file has LinkedIn credentials")
-        print("   2. Run individual example functions")
+        print("   2. Run run_browser_examples() or individual example functions")
         print("   3. Or use the main.py script for production usage")
         
     except Exception as e:
@@ -261,7 +291,5 @@ if __name__ == "__main__":
     # Run examples that don't require browser by default
     run_all_examples()
     
-    # Uncomment to run browser-based examples:
-    # example_1_single_profile()
-    # example_2_bulk_extraction() 
-    # example_3_contact_extraction()
\ No newline at end of file
+    # Uncomment to run browser-based examples (they share one browser):
+    # run_browser_examples()
\ No newline at end of file
@@ -26,52 +26,140 @@ Examples:
 
 import os
 import sys
+import csv
+import time
+import queue
 import argparse
 import logging
-from typing import List, Dict, Optional
+import logging.handlers
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import TYPE_CHECKING, List, Dict, Iterable, Iterator, Optional
+from pathlib import Path
 from datetime import datetime
 
-# Add current directory to path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+# Put this directory first on the path so local modules win over installed namesakes
+_here = str(Path(__file__).resolve().parent)
+if _here not in sys.path:
+    sys.path.insert(0, _here)
 
-from working_linkedin_extractor import WorkingLinkedInExtractor, LinkedInProfile
-from database_storage import LinkedInDatabaseStorage, export_profiles_to_csv
-from stealth_browser import create_enhanced_browser, BrowserConfig
-from contact_extraction_demo import ContactExtractionDemo
+# Browser modules pull in selenium and undetected_chromedriver, so they are
+# imported only by the commands that drive a browser (--stats needs just the DB)
+from database_storage import LinkedInDatabaseStorage
 
-# Configure logging
+if TYPE_CHECKING:
+    from working_linkedin_extractor import WorkingLinkedInExtractor, LinkedInProfile
+
+# Configure logging (the log file name carries the date, so records only show the time)
+log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s', datefmt='%H:%M:%S')
+file_handler = logging.FileHandler(f'linkedin_scraper_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log')
+file_handler.setFormatter(log_formatter)
+console_handler = logging.StreamHandler()
+console_handler.setFormatter(log_formatter)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler(f'linkedin_scraper_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log'),
-        logging.StreamHandler()
+        # File writes go out in batches of 1000 records, right away on errors,
+        # and on exit when logging shuts down
+        logging.handlers.MemoryHandler(1000, flushLevel=logging.ERROR, target=file_handler),
+        console_handler
     ]
 )
 logger = logging.getLogger(__name__)
 
+# URL fragments LinkedIn redirects to once the login form has been submitted
+LOGIN_REDIRECT_MARKERS = ("linkedin.com/feed", "linkedin.com/in/", "challenge")
+
+# Explicit waits poll twice as often as selenium's 0.5s default
+WAIT_TIMEOUT = 15
+WAIT_POLL_FREQUENCY = 0.25
+
+# Bulk extraction saves profiles in one transaction per batch, flushed when the
+# batch is full or has been waiting this many seconds
+SAVE_BATCH_SIZE = 50
+SAVE_FLUSH_INTERVAL = 30.0
+
+# Bulk URLs are consumed this many at a time, so huge URL files are never held in memory
+URL_CHUNK_SIZE = 200
+
+# Bulk extraction skips profiles successfully extracted within this many days
+# (unless --force is given)
+RECENT_EXTRACTION_DAYS = 7
+
+# Column order for CSV files streamed during extraction (LinkedInProfile fields)
+EXPORT_FIELDS = (
+    "full_name", "linkedin_url", "role", "company", "company_linkedin_url",
+    "geography", "date_added", "headline", "about", "location", "connections_count",
+    "emails", "phones", "websites", "social_links", "addresses",
+    "profile_type", "extraction_timestamp", "extraction_success"
+)
+
+def profile_to_row(profile: "LinkedInProfile") -> List:
+    """Flatten a profile into an EXPORT_FIELDS row, joining list fields with '; '"""
+    row = []
+    for name in EXPORT_FIELDS:
+        value = getattr(profile, name)
+        row.append("; ".join(value) if isinstance(value, list) else value)
+    return row
+
 class LinkedInScraperMain:
     """Main LinkedIn scraper application"""
     
-    def __init__(self, headless: bool = True, use_stealth: bool = True):
+    # Login form locators; the By.ID / By.CSS_SELECTOR values are spelled out
+    # so selenium is only imported once a browser is needed
+    _USERNAME_LOCATOR = ("id", "username")
+    _PASSWORD_LOCATOR = ("id", "password")
+    _SUBMIT_LOCATOR = ("css selector", "button[type=submit]")
+    
+    # Sets a field's value in one WebDriver call instead of one call per keystroke
+    _FILL_FIELD_JS = (
+        "arguments[0].value = arguments[1];"
+        "arguments[0].dispatchEvent(new Event('input', {bubbles: true}));"
+    )
+    
+    def __init__(self, headless: bool = True, use_stealth: bool = True, workers: int = None,
+                 fast_login: bool = False):
         self.headless = headless
         self.use_stealth = use_stealth
+        # Fill the login form with script instead of keystrokes (faster, but
+        # visible to bot detection that watches key events)
+        self.fast_login = fast_login
+        # Browsers used for bulk extraction; defaults to MAX_CONCURRENT_BROWSERS (or 1)
+        self.workers = workers
         self.driver = None
         self.extractor = None
+        self.extractors = []
+        self._waits = {}  # driver -> WebDriverWait
         self.storage = None
+        self._username = os.getenv('LINKEDIN_USERNAME')
+        self._password = os.getenv('LINKEDIN_PASSWORD')
         
-    def initialize(self) -> bool:
-        """Initialize the scraper components"""
+    def initialize(self, browser: bool = True) -> bool:
+        """Initialize the scraper components (database only when browser is False)"""
         try:
             logger.info("🚀 Initializing LinkedIn Scraper")
             
+            self.storage = LinkedInDatabaseStorage()
+            if not browser:
+                logger.info("✅ LinkedIn Scraper initialized successfully")
+                return True
+            
+            from working_linkedin_extractor import WorkingLinkedInExtractor
+            from stealth_browser import create_enhanced_browsers, BrowserConfig
+            
             # Create browser
             config = BrowserConfig()
             config.headless = self.headless
             
-            self.driver = create_enhanced_browser(use_stealth=self.use_stealth, config=config)
-            self.extractor = WorkingLinkedInExtractor(self.driver)
-            self.storage = LinkedInDatabaseStorage()
+            workers = self.workers
+            if workers is None:
+                workers = int(os.getenv("MAX_CONCURRENT_BROWSERS", "1"))
+            
+            # Selenium drivers are not thread-safe, so each worker gets its own browser
+            drivers = create_enhanced_browsers(max(workers, 1), use_stealth=self.use_stealth, config=config)
+            self.extractors.extend(WorkingLinkedInExtractor(driver) for driver in drivers)
+            self.extractor = self.extractors[0]
+            self.driver = self.extractor.driver
             
             logger.info("✅ LinkedIn Scraper initialized successfully")
             return True
@@ -81,51 +169,50 @@ class LinkedInScraperMain:
             return False
     
     def login_to_linkedin(self) -> bool:
-        """Login to LinkedIn using credentials from environment"""
+        """Login to LinkedIn in every browser using credentials from environment"""
+        if not self._username or not self._password:
+            logger.error("❌ LinkedIn credentials not found in environment")
+            logger.info("Please set LINKEDIN_USERNAME and LINKEDIN_PASSWORD in .env file")
+            return False
+        
+        return all(self._login_driver(extractor.driver) for extractor in self.extractors)
+    
+    def _login_driver(self, driver) -> bool:
+        """Login to LinkedIn in a single browser"""
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.support import expected_conditions as EC
+        
         try:
-            username = os.getenv('LINKEDIN_USERNAME')
-            password = os.getenv('LINKEDIN_PASSWORD')
-            
-            if not username or not password:
-                logger.error("❌ LinkedIn credentials not found in environment")
-                logger.info("Please set LINKEDIN_USERNAME and LINKEDIN_PASSWORD in .env file")
-                return False
-            
             logger.info("🔐 Logging into LinkedIn...")
             
             # Navigate to LinkedIn login
-            self.driver.get("https://www.linkedin.com/login")
+            driver.get("https://www.linkedin.com/login")
             
-            # Wait for page load
-            import time
-            time.sleep(3)
-            
-            # Find and fill login form
-            from selenium.webdriver.common.by import By
-            from selenium.webdriver.support.ui import WebDriverWait
-            from selenium.webdriver.support import expected_conditions as EC
-            
-            wait = WebDriverWait(self.driver, 10)
+            # Find and fill login form (the wait returns as soon as the form renders)
+            wait = self._get_wait(driver)
             
             # Enter username
-            username_field = wait.until(EC.presence_of_element_located((By.ID, "username")))
-            username_field.clear()
-            username_field.send_keys(username)
+            username_field = wait.until(EC.presence_of_element_located(self._USERNAME_LOCATOR))
+            self._fill_field(driver, username_field, self._username)
             
             # Enter password
-            password_field = self.driver.find_element(By.ID, "password")
-            password_field.clear()
-            password_field.send_keys(password)
+            password_field = driver.find_element(*self._PASSWORD_LOCATOR)
+            self._fill_field(driver, password_field, self._password)
             
             # Click sign in
-            signin_button = self.driver.find_element(By.XPATH, "//button[@type='submit']")
+            signin_button = driver.find_element(*self._SUBMIT_LOCATOR)
             signin_button.click()
             
-            # Wait for login to complete
-            time.sleep(5)
+            # Wait for LinkedIn to redirect away from the login form
+            try:
+                wait.until(
+                    lambda d: any(marker in d.current_url for marker in LOGIN_REDIRECT_MARKERS)
+                )
+            except TimeoutException:
+                pass  # Still on the login page; reported as a failed login below
             
             # Check if login was successful
-            current_url = self.driver.current_url
+            current_url = driver.current_url
             if "linkedin.com/feed" in current_url or "linkedin.com/in/" in current_url:
                 logger.info("✅ Successfully logged into LinkedIn")
                 return True
@@ -142,22 +229,39 @@ class LinkedInScraperMain:
             logger.error(f"❌ Error during LinkedIn login: {e}")
             return False
     
-    def extract_single_profile(self, profile_url: str) -> Optional[LinkedInProfile]:
-        """Extract a single LinkedIn profile"""
+    def _get_wait(self, driver):
+        """WebDriverWait shared by everything waiting on this browser"""
+        wait = self._waits.get(driver)
+        if wait is None:
+            from selenium.webdriver.support.ui import WebDriverWait
+            wait = self._waits[driver] = WebDriverWait(driver, WAIT_TIMEOUT, poll_frequency=WAIT_POLL_FREQUENCY)
+        return wait
+    
+    def _fill_field(self, driver, field, value: str):
+        """Type a value into a form field, or set it directly with --fast-login"""
+        if self.fast_login:
+            driver.execute_script(self._FILL_FIELD_JS, field, value)
+        else:
+            field.clear()
+            field.send_keys(value)
+    
+    def extract_single_profile(self, profile_url: str, extractor: "WorkingLinkedInExtractor" = None,
+                               save: bool = True) -> Optional["LinkedInProfile"]:
+        """Extract a single LinkedIn profile, saving it unless save is False"""
         try:
             logger.info(f"🎯 Extracting profile: {profile_url}")
             
-            profile = self.extractor.extract_profile(profile_url)
+            profile = (extractor or self.extractor).extract_single(profile_url)
             
-            if isinstance(profile, LinkedInProfile) and profile.extraction_success:
-                # Save to database
-                profile_id = self.storage.save_profile(profile)
-                
+            if profile.extraction_success:
                 logger.info(f"✅ Successfully extracted: {profile.full_name}")
                 logger.info(f"   📧 Emails: {len(profile.emails)}")
                 logger.info(f"   📱 Phones: {len(profile.phones)}")
                 logger.info(f"   🌐 Websites: {len(profile.websites)}")
-                logger.info(f"   💾 Saved to database with ID: {profile_id}")
+                
+                if save:
+                    profile_id = self.storage.save_profile(profile)
+                    logger.info(f"   💾 Saved to database with ID: {profile_id}")
                 
                 return profile
             else:
@@ -168,40 +272,91 @@ class LinkedInScraperMain:
             logger.error(f"❌ Error extracting profile {profile_url}: {e}")
             return None
     
-    def extract_bulk_profiles(self, profile_urls: List[str]) -> List[LinkedInProfile]:
+    def extract_bulk_profiles(self, profile_urls: Iterable[str], force: bool = False) -> List["LinkedInProfile"]:
         """Extract multiple LinkedIn profiles"""
-        logger.info(f"🔄 Starting bulk extraction of {len(profile_urls)} profiles")
+        return list(self.iter_bulk_profiles(profile_urls, force))
+    
+    def iter_bulk_profiles(self, profile_urls: Iterable[str], force: bool = False) -> Iterator["LinkedInProfile"]:
+        """Extract multiple LinkedIn profiles, yielding each one as soon as it is ready
         
-        results = []
+        URLs are spread over the initialized browsers; each extractor paces its
+        own page loads, backing off only when LinkedIn starts throttling.
+        URLs may be any iterable and are taken URL_CHUNK_SIZE at a time.
+        Profiles are saved in batches of SAVE_BATCH_SIZE. Unless force is set,
+        profiles extracted within RECENT_EXTRACTION_DAYS are skipped.
+        """
+        workers = max(len(self.extractors), 1)
+        # Lists report i/total progress; streamed URLs only have a running position
+        total = len(profile_urls) if hasattr(profile_urls, '__len__') else None
+        logger.info(f"🔄 Starting bulk extraction of {total or 'streamed'} profiles ({workers} browsers)")
         
-        for i, url in enumerate(profile_urls, 1):
-            logger.info(f"\n[{i}/{len(profile_urls)}] Processing: {url}")
-            
-            profile = self.extract_single_profile(url)
-            if profile:
-                results.append(profile)
-            
-            # Add delay between requests to be respectful
-            if i < len(profile_urls):
-                import time
-                delay = 3
-                logger.info(f"⏳ Waiting {delay} seconds before next extraction...")
-                time.sleep(delay)
+        available = queue.Queue()
+        for extractor in self.extractors[:workers]:
+            available.put(extractor)
         
-        logger.info(f"\n✅ Bulk extraction completed")
-        logger.info(f"   Successfully extracted: {len(results)}/{len(profile_urls)} profiles")
-        logger.info(f"   Success rate: {len(results)/len(profile_urls)*100:.1f}%")
+        def extract_one(i: int, url: str) -> Optional["LinkedInProfile"]:
+            extractor = available.get()
+            try:
+                logger.info(f"\n[{i}/{total or '?'}] Processing: {url}")
+                return self.extract_single_profile(url, extractor, save=False)
+            finally:
+                available.put(extractor)
+        
+        urls = iter(profile_urls)
+        position = 0
+        processed = 0
+        extracted = 0
+        pending = []
+        last_flush = time.monotonic()
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # executor.map submits its whole input up front, so feed it one chunk at a time
+                for chunk in iter(lambda: list(islice(urls, URL_CHUNK_SIZE)), []):
+                    # Number URLs by input position so skipped ones don't shift the progress
+                    numbers = range(position + 1, position + len(chunk) + 1)
+                    position += len(chunk)
+                    
+                    if not force:
+                        recent = self.storage.get_already_extracted_urls(chunk, RECENT_EXTRACTION_DAYS)
+                        if recent:
+                            kept = [(i, url) for i, url in zip(numbers, chunk) if url not in recent]
+                            numbers = [i for i, _ in kept]
+                            chunk = [url for _, url in kept]
+                            logger.info(f"⏭️ Skipping {len(recent)} profiles extracted in the last {RECENT_EXTRACTION_DAYS} days")
+                    
+                    processed += len(chunk)
+                    for profile in executor.map(extract_one, numbers, chunk):
+                        if not profile:
+                            continue
+                        
+                        extracted += 1
+                        pending.append(profile)
+                        if len(pending) >= SAVE_BATCH_SIZE or time.monotonic() - last_flush >= SAVE_FLUSH_INTERVAL:
+                            self.storage.save_profiles_bulk(pending)
+                            pending = []
+                            last_flush = time.monotonic()
+                        yield profile
+        finally:
+            # Also runs when the consumer stops early, so extracted profiles are never dropped
+            if pending:
+                self.storage.save_profiles_bulk(pending)
         
-        return results
+        if not processed:
+            logger.info("✅ Nothing to extract")
+            return
+        
+        logger.info(f"\n✅ Bulk extraction completed")
+        logger.info(f"   Successfully extracted: {extracted}/{processed} profiles")
+        logger.info(f"   Success rate: {extracted/processed*100:.1f}%")
     
-    def extract_sales_navigator_search(self, search_url: str) -> List[LinkedInProfile]:
+    def extract_sales_navigator_search(self, search_url: str) -> List["LinkedInProfile"]:
         """Extract profiles from Sales Navigator search results"""
         try:
             logger.info(f"🔍 Extracting Sales Navigator search: {search_url}")
             
-            profiles = self.extractor.extract_profile(search_url)
+            profiles = self.extractor.extract_search(search_url)
             
-            if isinstance(profiles, list):
+            if profiles:
                 # Save all profiles to database
                 saved_count = 0
                 for profile in profiles:
@@ -222,12 +377,33 @@ class LinkedInScraperMain:
             logger.error(f"❌ Error extracting Sales Navigator search: {e}")
             return []
     
+    def stream_to_csv(self, profiles: Iterable["LinkedInProfile"], filename: str) -> int:
+        """Write profiles to CSV as they arrive, returning how many were written"""
+        logger.info(f"📊 Streaming results to: {filename}")
+        
+        written = 0
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(EXPORT_FIELDS)
+            for profile in profiles:
+                writer.writerow(profile_to_row(profile))
+                # Flush per row so the file is usable while extraction is still running
+                f.flush()
+                written += 1
+        
+        if written:
+            logger.info(f"✅ Results exported to: {filename}")
+        else:
+            os.remove(filename)
+            logger.warning("⚠️ No profiles extracted, nothing exported")
+        return written
+    
     def export_results(self, filename: str, **filters) -> str:
         """Export extraction results to CSV"""
         try:
             logger.info(f"📊 Exporting results to: {filename}")
             
-            exported_file = export_profiles_to_csv(filename, **filters)
+            exported_file = self.storage.export_to_csv(filename, **filters)
             
             if exported_file:
                 logger.info(f"✅ Results exported to: {exported_file}")
@@ -259,23 +435,30 @@ class LinkedInScraperMain:
     
     def cleanup(self):
         """Cleanup resources"""
+        if self.storage:
+            self.storage.close()
+        
         try:
-            if self.driver:
-                self.driver.quit()
+            for extractor in self.extractors:
+                extractor.driver.quit()
+            if self.extractors:
                 logger.info("✅ Browser cleanup completed")
         except Exception as e:
             logger.warning(f"⚠️ Cleanup warning: {e}")
 
-def load_urls_from_file(filename: str) -> List[str]:
-    """Load URLs from a text file"""
+def iter_urls_from_file(filename: str) -> Iterator[str]:
+    """Read URLs from a text file line by line, skipping comments and repeats"""
+    seen = set()
     try:
         with open(filename, 'r') as f:
-            urls = [line.strip() for line in f if line.strip() and not line.startswith('#')]
-        logger.info(f"📂 Loaded {len(urls)} URLs from {filename}")
-        return urls
+            for line in f:
+                url = line.strip()
+                if url and not url.startswith('#') and url not in seen:
+                    seen.add(url)
+                    yield url
+        logger.info(f"📂 Read {len(seen)} URLs from {filename}")
     except Exception as e:
         logger.error(f"❌ Error loading URLs from {filename}: {e}")
-        return []
 
 def main():
     """Main entry point"""
@@ -290,6 +473,9 @@ def main():
     parser.add_argument('--headless', action='store_true', help='Run browser in headless mode')
     parser.add_argument('--no-stealth', action='store_true', help='Disable stealth mode')
     parser.add_argument('--no-login', action='store_true', help='Skip LinkedIn login')
+    parser.add_argument('--fast-login', action='store_true', help='Fill the login form via JavaScript instead of keystrokes')
+    parser.add_argument('--force', action='store_true', help='Re-extract profiles even if they were extracted recently')
+    parser.add_argument('--workers', type=int, help='Browsers used for bulk extraction (default: MAX_CONCURRENT_BROWSERS)')
     
     # Output options
     parser.add_argument('--export-csv', help='Export results to CSV file')
@@ -307,20 +493,23 @@ def main():
     # Initialize scraper
     scraper = LinkedInScraperMain(
         headless=args.headless,
-        use_stealth=not args.no_stealth
+        use_stealth=not args.no_stealth,
+        workers=args.workers,
+        fast_login=args.fast_login
     )
     
     try:
-        # Initialize components
-        if not scraper.initialize():
+        # Initialize components; stats and the demo (which has its own browsers) need only the DB
+        if not scraper.initialize(browser=any([args.url, args.bulk, args.sales_navigator])):
             logger.error("❌ Failed to initialize scraper")
             return
         
         # Handle demo mode
         if args.demo:
             logger.info("🎉 Running contact extraction demo")
+            from contact_extraction_demo import ContactExtractionDemo
             demo = ContactExtractionDemo()
-            if demo.initialize():
+            if demo.initialize(demo_mode=not args.headless):
                 demo_profiles = [
                     "https://www.linkedin.com/in/williamhgates/",
                     "https://www.linkedin.com/in/jeffweiner08/"
@@ -340,34 +529,31 @@ def main():
                 logger.error("❌ LinkedIn login required for extraction")
                 return
         
-        # Process extraction requests
-        results = []
-        
-        if args.url:
-            profile = scraper.extract_single_profile(args.url)
-            if profile:
-                results.append(profile)
-        
-        if args.bulk:
-            urls = load_urls_from_file(args.bulk)
-            if urls:
-                bulk_results = scraper.extract_bulk_profiles(urls)
-                results.extend(bulk_results)
-        
-        if args.sales_navigator:
-            sn_results = scraper.extract_sales_navigator_search(args.sales_navigator)
-            results.extend(sn_results)
+        # Process extraction requests lazily so results can be exported as they arrive
+        def extracted_profiles() -> Iterator["LinkedInProfile"]:
+            if args.url:
+                profile = scraper.extract_single_profile(args.url)
+                if profile:
+                    yield profile
+            
+            if args.bulk:
+                yield from scraper.iter_bulk_profiles(iter_urls_from_file(args.bulk), force=args.force)
+            
+            if args.sales_navigator:
+                yield from scraper.extract_sales_navigator_search(args.sales_navigator)
         
         # Export results if requested
-        if args.export_csv and results:
-            scraper.export_results(args.export_csv)
+        if args.export_csv:
+            processed = scraper.stream_to_csv(extracted_profiles(), args.export_csv)
+        else:
+            processed = sum(1 for _ in extracted_profiles())
         
         # Show statistics
         if args.stats:
             scraper.get_statistics()
         
         logger.info(f"\n🎉 LinkedIn scraping session completed!")
-        logger.info(f"Total profiles processed: {len(results)}")
+        logger.info(f"Total profiles processed: {processed}")
         
     except KeyboardInterrupt:
         logger.info("\n⚠️ Scraping interrupted by user")
@@ -14,33 +14,69 @@ Key Features:
 """
 
 import os
+import importlib.util
+import queue
+import atexit
 import logging
+import threading
 import time
 import random
-from typing import Optional, Dict, Any
+import shutil
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Iterator, List
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.chrome.service import Service as ChromeService
 from webdriver_manager.chrome import ChromeDriverManager
 
-# Enhanced imports (with fallback handling)
-try:
-    import undetected_chromedriver as uc
-    STEALTH_AVAILABLE = True
-    print("✅ Stealth browser capabilities available")
-except ImportError:
-    STEALTH_AVAILABLE = False
-    print("⚠️  Stealth browser not available, using standard Selenium")
-
-try:
-    from fake_useragent import UserAgent
-    FAKE_UA_AVAILABLE = True
-except ImportError:
-    FAKE_UA_AVAILABLE = False
-
 # Configuration
 logger = logging.getLogger(__name__)
 
+# Enhanced libraries are only probed here and imported on first use;
+# undetected_chromedriver alone takes a few hundred milliseconds to import
+STEALTH_AVAILABLE = importlib.util.find_spec("undetected_chromedriver") is not None
+if STEALTH_AVAILABLE:
+    logger.debug("Stealth browser capabilities available")
+else:
+    logger.debug("Stealth browser not available, using standard Selenium")
+
+FAKE_UA_AVAILABLE = importlib.util.find_spec("fake_useragent") is not None
+
+# Runs Chrome as one process (no zygote, no per-site renderers) to start faster.
+# Site isolation gets its own switch because Chrome only honours the last
+# --disable-features; --no-zygote refuses to start with the sandbox enabled.
+SINGLE_PROCESS_ARGS = ("--single-process", "--no-zygote", "--no-sandbox", "--disable-site-isolation-trials")
+
+# Stops Blink from fetching images at all, rather than fetching and not showing them
+DISABLE_IMAGES_ARG = "--blink-settings=imagesEnabled=false"
+
+# URL patterns blocked by block_resource_loading (images, stylesheets, web fonts)
+BLOCKED_RESOURCE_PATTERNS = ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.svg", "*.css", "*.woff", "*.woff2"]
+
+# Chrome arguments every stealth browser gets, whatever its configuration
+STEALTH_CHROME_ARGS = (
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-blink-features=AutomationControlled",
+    "--disable-web-security",
+    "--disable-features=VizDisplayCompositor",
+)
+
+# Hides the webdriver flag and fakes plugins and languages (see enhance_browser_stealth);
+# each override is guarded so one already locked down does not skip the rest
+STEALTH_JS = """
+for (const [name, value] of [['webdriver', undefined], ['plugins', [1, 2, 3, 4, 5]], ['languages', ['en-US', 'en']]]) {
+    try { Object.defineProperty(navigator, name, {get: () => value}); } catch (e) {}
+}
+"""
+
+# Site whose stored data is wiped before a pooled browser is reused
+POOL_RESET_ORIGIN = "https://www.linkedin.com"
+
+# Idle browsers StealthBrowser keeps warm per browser setup (0 disables pooling)
+BROWSER_POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", "3"))
+
 class BrowserConfig:
     """Configuration class for browser settings"""
     
@@ -53,51 +89,109 @@ class BrowserConfig:
         self.stealth_mode = os.getenv("STEALTH_MODE", "true").lower() == "true"
         self.rotate_user_agent = os.getenv("ROTATE_USER_AGENT", "true").lower() == "true"
         self.window_size = os.getenv("WINDOW_SIZE", "1920,1080")
+        # 'eager' returns from driver.get() at DOMContentLoaded instead of full load
+        self.page_load_strategy = os.getenv("PAGE_LOAD_STRATEGY", "eager")
+        # One Chrome process instead of one per renderer; for short-lived headless runs
+        self.single_process = os.getenv("CHROME_SINGLE_PROCESS", "false").lower() == "true"
         
         # Anti-detection settings
         self.disable_blink_features = True
         self.disable_extensions = True
         self.disable_plugins = True
         self.disable_images = os.getenv("DISABLE_IMAGES", "false").lower() == "true"
+        # Random pauses that mimic a person; unattended bulk runs can turn them off
+        self.human_mimic = os.getenv("HUMAN_MIMIC", "true").lower() == "true"
+    
+    @property
+    def window_size_arg(self) -> str:
+        """Chrome argument for the configured "width,height" window size"""
+        return f"--window-size={self.window_size}"
+
+
+# Used when fake_useragent is missing or fails
+FALLBACK_USER_AGENTS = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+# UserAgent() loads its whole browser database and each .random scans it, so a
+# handful of picks is sampled once and handed out in turn
+USER_AGENT_RING_SIZE = 16
+_user_agent_ring = None
+_user_agent_lock = threading.Lock()
+
+
+def _get_user_agent_ring() -> Iterator[str]:
+    """Sample the shared user agent ring on first use"""
+    global _user_agent_ring
+    if _user_agent_ring is None:
+        with _user_agent_lock:
+            if _user_agent_ring is None:
+                from fake_useragent import UserAgent
+                user_agent = UserAgent()
+                _user_agent_ring = itertools.cycle([user_agent.random for _ in range(USER_AGENT_RING_SIZE)])
+    return _user_agent_ring
 
 
 def get_random_user_agent() -> str:
     """Get a random user agent string"""
     if FAKE_UA_AVAILABLE:
         try:
-            ua = UserAgent()
-            return ua.random
+            return next(_get_user_agent_ring())
         except Exception as e:
             logger.warning(f"Failed to get random user agent: {e}")
     
-    # Fallback user agents
-    fallback_agents = [
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-    ]
-    return random.choice(fallback_agents)
+    return random.choice(FALLBACK_USER_AGENTS)
 
 
-def get_stealth_chrome_options(config: BrowserConfig) -> ChromeOptions:
-    """Get Chrome options optimized for stealth mode"""
-    options = ChromeOptions()
+# How each kind of browser differs; everything else comes from the BrowserConfig
+_OPTION_RECIPES = {
+    "stealth": {
+        "headless_arg": "--headless=new",
+        "args": STEALTH_CHROME_ARGS,
+        "user_agent": True,
+    },
+    "original": {
+        "headless_arg": "--headless",
+        "args": ("--no-sandbox", "--disable-dev-shm-usage"),
+        "user_agent": False,
+    },
+    "undetected": {
+        "headless_arg": "--headless=new",
+        "args": ("--no-first-run", "--no-service-autorun", "--password-store=basic"),
+        "user_agent": True,
+    },
+}
+
+
+def _configure_options(options: ChromeOptions, recipe_name: str, config: BrowserConfig) -> ChromeOptions:
+    """Fill in Chrome options from a recipe in _OPTION_RECIPES and the config"""
+    recipe = _OPTION_RECIPES[recipe_name]
+    options.page_load_strategy = config.page_load_strategy
     
-    # Basic settings
+    arguments = [config.window_size_arg, *recipe["args"]]
     if config.headless:
-        options.add_argument("--headless=new")
+        arguments.append(recipe["headless_arg"])
+    if config.disable_images:
+        arguments.append(DISABLE_IMAGES_ARG)
+    if config.single_process:
+        arguments.extend(SINGLE_PROCESS_ARGS)
     
-    # Window size
-    width, height = config.window_size.split(',')
-    options.add_argument(f"--window-size={width},{height}")
+    # User agent rotation
+    if recipe["user_agent"] and config.rotate_user_agent:
+        user_agent = get_random_user_agent()
+        arguments.append(f"--user-agent={user_agent}")
+        logger.info(f"Using user agent: {user_agent[:50]}...")
     
-    # Anti-detection arguments
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--disable-blink-features=AutomationControlled")
-    options.add_argument("--disable-web-security")
-    options.add_argument("--disable-features=VizDisplayCompositor")
+    for argument in arguments:
+        options.add_argument(argument)
+    return options
+
+
+def get_stealth_chrome_options(config: BrowserConfig) -> ChromeOptions:
+    """Get Chrome options optimized for stealth mode"""
+    options = _configure_options(ChromeOptions(), "stealth", config)
     
     # Experimental options for stealth
     try:
@@ -106,40 +200,30 @@ def get_stealth_chrome_options(config: BrowserConfig) -> ChromeOptions:
     except Exception as e:
         logger.warning(f"Could not set experimental options: {e}")
     
-    # Additional stealth options
-    if config.disable_images:
-        try:
-            prefs = {"profile.managed_default_content_settings.images": 2}
-            options.add_experimental_option("prefs", prefs)
-        except Exception as e:
-            logger.warning(f"Could not disable images: {e}")
-    
-    # User agent rotation
-    if config.rotate_user_agent:
-        user_agent = get_random_user_agent()
-        options.add_argument(f"--user-agent={user_agent}")
-        logger.info(f"Using user agent: {user_agent[:50]}...")
-    
     return options
 
 
+# chromedriver path from webdriver-manager, resolved once per process
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+
+def _get_driver_path() -> str:
+    """Install (or find the cached) chromedriver once; failures are retried next call"""
+    global _driver_path
+    with _driver_path_lock:
+        if _driver_path is None:
+            _driver_path = ChromeDriverManager().install()
+        return _driver_path
+
+
 def get_original_selenium_driver(config: BrowserConfig) -> webdriver.Chrome:
     """Get original Selenium Chrome driver (backward compatibility)"""
-    options = ChromeOptions()
-    
-    if config.headless:
-        options.add_argument("--headless")
-    
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    
-    # Window size
-    width, height = config.window_size.split(',')
-    options.add_argument(f"--window-size={width},{height}")
+    options = _configure_options(ChromeOptions(), "original", config)
     
     # Use webdriver manager for automatic driver management
     try:
-        driver_path = ChromeDriverManager().install()
+        driver_path = _get_driver_path()
         service = ChromeService(driver_path)
         driver = webdriver.Chrome(service=service, options=options)
         
@@ -147,10 +231,8 @@ def get_original_selenium_driver(config: BrowserConfig) -> webdriver.Chrome:
         logger.warning(f"WebDriver Manager failed: {e}")
         # Fallback: try to find system chromedriver
         try:
-            import subprocess
-            result = subprocess.run(['which', 'chromedriver'], capture_output=True, text=True)
-            if result.returncode == 0:
-                driver_path = result.stdout.strip()
+            driver_path = shutil.which('chromedriver')
+            if driver_path:
                 logger.info(f"Using system chromedriver: {driver_path}")
                 service = ChromeService(driver_path)
                 driver = webdriver.Chrome(service=service, options=options)
@@ -160,8 +242,8 @@ def get_original_selenium_driver(config: BrowserConfig) -> webdriver.Chrome:
             logger.error(f"All chromedriver methods failed: {e2}")
             raise Exception(f"Could not create Chrome driver: {e}, {e2}")
     
-    # Set timeouts
-    driver.implicitly_wait(config.timeout)
+    # Set timeouts (no implicit wait: lookups run after the page has settled, and
+    # an implicit wait would stall every selector miss for the full timeout)
     driver.set_page_load_timeout(config.timeout)
     
     return driver
@@ -173,32 +255,15 @@ def get_undetected_chrome_driver(config: BrowserConfig) -> webdriver.Chrome:
         raise ImportError("undetected-chromedriver not available")
     
     try:
-        # Configure undetected Chrome options
-        options = uc.ChromeOptions()
+        import undetected_chromedriver as uc
         
-        # Add stealth arguments
-        if config.headless:
-            options.add_argument("--headless=new")
-        
-        # Window size
-        width, height = config.window_size.split(',')
-        options.add_argument(f"--window-size={width},{height}")
-        
-        # Additional stealth options
-        options.add_argument("--no-first-run")
-        options.add_argument("--no-service-autorun")
-        options.add_argument("--password-store=basic")
-        
-        # User agent
-        if config.rotate_user_agent:
-            user_agent = get_random_user_agent()
-            options.add_argument(f"--user-agent={user_agent}")
+        # Configure undetected Chrome options
+        options = _configure_options(uc.ChromeOptions(), "undetected", config)
         
         # Create undetected Chrome driver
         driver = uc.Chrome(options=options, version_main=None)
         
-        # Set timeouts
-        driver.implicitly_wait(config.timeout)
+        # Set timeouts (no implicit wait, see get_original_selenium_driver)
         driver.set_page_load_timeout(config.timeout)
         
         # Additional stealth enhancements
@@ -242,7 +307,8 @@ def create_enhanced_browser(use_stealth: bool = None, config: BrowserConfig = No
             driver = get_original_selenium_driver(config)
         
         # Add random startup delay to appear more human
-        add_random_delay(1, 3)
+        if config.human_mimic:
+            add_random_delay(1, 3)
         
         logger.info(f"✅ Browser created successfully (stealth: {use_stealth})")
         return driver
@@ -258,25 +324,36 @@ def create_enhanced_browser(use_stealth: bool = None, config: BrowserConfig = No
             raise
 
 
+def create_enhanced_browsers(count: int, use_stealth: bool = None,
+                             config: BrowserConfig = None) -> List[webdriver.Chrome]:
+    """
+    Create several browsers, overlapping their startup and humanising delays
+    
+    The first browser is started on its own so undetected_chromedriver patches
+    its chromedriver binary once instead of several starts racing on the file.
+    If any browser fails to start, the ones already running are quit.
+    """
+    drivers = [create_enhanced_browser(use_stealth, config)]
+    if count <= 1:
+        return drivers
+    
+    with ThreadPoolExecutor(max_workers=count - 1) as executor:
+        futures = [executor.submit(create_enhanced_browser, use_stealth, config) for _ in range(count - 1)]
+    
+    errors = [future.exception() for future in futures if future.exception()]
+    drivers.extend(future.result() for future in futures if not future.exception())
+    if errors:
+        for driver in drivers:
+            _quit_driver(driver)
+        raise errors[0]
+    return drivers
+
+
 def enhance_browser_stealth(driver: webdriver.Chrome) -> None:
     """Apply additional stealth enhancements to existing driver"""
     try:
-        # Execute stealth scripts
-        driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
-        
-        # Override chrome object
-        driver.execute_script("""
-            Object.defineProperty(navigator, 'plugins', {
-                get: () => [1, 2, 3, 4, 5],
-            });
-        """)
-        
-        # Override languages
-        driver.execute_script("""
-            Object.defineProperty(navigator, 'languages', {
-                get: () => ['en-US', 'en'],
-            });
-        """)
+        # Registered once, the overrides run before any page script on every navigation
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": STEALTH_JS})
         
         logger.debug("✅ Applied additional stealth enhancements")
         
@@ -284,33 +361,44 @@ def enhance_browser_stealth(driver: webdriver.Chrome) -> None:
         logger.warning(f"⚠️  Could not apply some stealth enhancements: {e}")
 
 
+def block_resource_loading(driver: webdriver.Chrome, patterns=None) -> None:
+    """Stop the browser from downloading resources the extractors never read"""
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns or BLOCKED_RESOURCE_PATTERNS})
+        logger.debug("✅ Blocked image, stylesheet and font requests")
+    except Exception as e:
+        logger.warning(f"⚠️  Could not block resource loading: {e}")
+
+
 def add_random_delay(min_seconds: float = 1.0, max_seconds: float = 3.0) -> None:
     """Add random delay to simulate human behavior"""
     delay = random.uniform(min_seconds, max_seconds)
     time.sleep(delay)
 
 
-def simulate_human_behavior(driver: webdriver.Chrome) -> None:
+def simulate_human_behavior(driver: webdriver.Chrome, config: BrowserConfig = None) -> None:
     """Simulate human-like behavior"""
+    if config is None:
+        config = BrowserConfig()
+    
     try:
-        # Random mouse movements (simplified)
-        driver.execute_script("""
-            var event = new MouseEvent('mousemove', {
-                'view': window,
-                'bubbles': true,
-                'cancelable': true,
-                'clientX': Math.random() * window.innerWidth,
-                'clientY': Math.random() * window.innerHeight
-            });
-            document.dispatchEvent(event);
-        """)
+        # Native input events: trusted by the page, unlike MouseEvents built in JS
+        width, height = (int(size) for size in config.window_size.split(','))
+        x, y = random.randint(0, width - 1), random.randint(0, height - 1)
+        
+        # Random mouse movement
+        driver.execute_cdp_cmd("Input.dispatchMouseEvent", {"type": "mouseMoved", "x": x, "y": y})
         
         # Random scroll
         scroll_amount = random.randint(100, 500)
-        driver.execute_script(f"window.scrollBy(0, {scroll_amount});")
+        driver.execute_cdp_cmd("Input.dispatchMouseEvent", {
+            "type": "mouseWheel", "x": x, "y": y, "deltaX": 0, "deltaY": scroll_amount
+        })
         
         # Random delay
-        add_random_delay(0.5, 2.0)
+        if config.human_mimic:
+            add_random_delay(0.5, 2.0)
         
     except Exception as e:
         logger.debug(f"Could not simulate human behavior: {e}")
@@ -324,24 +412,112 @@ def create_driver(headless: bool = False) -> webdriver.Chrome:
     return create_enhanced_browser(config=config)
 
 
+def _quit_driver(driver: webdriver.Chrome) -> None:
+    """Quit a driver, logging rather than raising if the browser is already gone"""
+    try:
+        driver.quit()
+    except Exception as e:
+        logger.warning(f"Error closing browser: {e}")
+
+
+def _reset_browser_state(driver: webdriver.Chrome) -> None:
+    """Forget cookies and site storage so the next user starts with a clean session
+    
+    The HTTP cache is kept: it holds no session state and keeps pooled browsers fast.
+    """
+    driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    driver.execute_cdp_cmd("Storage.clearDataForOrigin", {
+        "origin": POOL_RESET_ORIGIN,
+        "storageTypes": "local_storage,indexeddb,cache_storage,service_workers",
+    })
+    # Session storage belongs to the tab and has no CDP clear
+    driver.execute_script("try { sessionStorage.clear(); } catch (e) {}")
+
+
+class _BrowserPool:
+    """Warm browsers handed from one StealthBrowser context to the next
+    
+    Idle drivers are kept per browser setup, at most `size` of each; anything
+    beyond that is quit on release, and whatever is left is quit at exit.
+    """
+    
+    def __init__(self, size: int):
+        self.size = size
+        self._idle: Dict[tuple, queue.Queue] = {}
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+    
+    def _queue(self, key: tuple) -> queue.Queue:
+        with self._lock:
+            if key not in self._idle:
+                self._idle[key] = queue.Queue(maxsize=self.size)
+            return self._idle[key]
+    
+    def acquire(self, key: tuple, use_stealth: Optional[bool], config: BrowserConfig) -> webdriver.Chrome:
+        """Reuse an idle browser for this setup, starting a new one if none is alive"""
+        idle = self._queue(key)
+        while True:
+            try:
+                driver = idle.get_nowait()
+            except queue.Empty:
+                return create_enhanced_browser(use_stealth, config)
+            try:
+                driver.current_url  # Raises if Chrome died while idle
+                return driver
+            except Exception:
+                _quit_driver(driver)
+    
+    def release(self, key: tuple, driver: webdriver.Chrome) -> None:
+        """Clean a browser and keep it for the next context, or quit it"""
+        if self.size <= 0:
+            _quit_driver(driver)
+            return
+        try:
+            _reset_browser_state(driver)
+            self._queue(key).put_nowait(driver)
+        except Exception as e:
+            # Pool full, or a browser too broken to clean is not worth keeping
+            logger.debug(f"Not pooling browser: {e!r}")
+            _quit_driver(driver)
+    
+    def close(self) -> None:
+        """Quit every idle browser"""
+        with self._lock:
+            queues = list(self._idle.values())
+            self._idle.clear()
+        for idle in queues:
+            while True:
+                try:
+                    _quit_driver(idle.get_nowait())
+                except queue.Empty:
+                    break
+
+
+_browser_pool = _BrowserPool(BROWSER_POOL_SIZE)
+
+
 class StealthBrowser:
-    """Context manager for stealth browser"""
+    """Context manager for stealth browser
+    
+    Browsers come from a shared pool: leaving the context clears the session
+    and keeps the browser warm for the next one instead of quitting it.
+    """
     
     def __init__(self, use_stealth: bool = None, config: BrowserConfig = None):
         self.use_stealth = use_stealth
-        self.config = config
+        self.config = config or BrowserConfig()
         self.driver = None
+        # Only browsers started with the same settings are interchangeable
+        self._pool_key = (use_stealth, tuple(sorted(vars(self.config).items())))
     
     def __enter__(self) -> webdriver.Chrome:
-        self.driver = create_enhanced_browser(self.use_stealth, self.config)
+        self.driver = _browser_pool.acquire(self._pool_key, self.use_stealth, self.config)
         return self.driver
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         if self.driver:
-            try:
-                self.driver.quit()
-            except Exception as e:
-                logger.warning(f"Error closing browser: {e}")
+            _browser_pool.release(self._pool_key, self.driver)
+            self.driver = None
 
 
 # Usage examples and testing
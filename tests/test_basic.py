@@ -6,17 +6,26 @@ This file contains essential tests to verify the scraper components work correct
 Run these tests before deploying to production.
 """
 
+import gc
+import importlib
+import logging
 import os
 import sys
+import tempfile
 import unittest
-from unittest.mock import Mock, patch
+import weakref
+from unittest.mock import MagicMock, Mock, PropertyMock, patch
 
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from working_linkedin_extractor import LinkedInProfile, WorkingLinkedInExtractor
-from database_storage import LinkedInDatabaseStorage
-from stealth_browser import BrowserConfig, get_random_user_agent
+import working_linkedin_extractor
+from working_linkedin_extractor import LinkedInProfile, WorkingLinkedInExtractor, _add_contacts, _scan_contacts
+import database_storage
+from database_storage import LinkedInDatabaseStorage, _copy_field, _social_platform
+from contact_extraction_demo import ContactExtractionDemo
+import stealth_browser
+from stealth_browser import BrowserConfig, StealthBrowser, get_random_user_agent
 
 class TestLinkedInProfile(unittest.TestCase):
     """Test LinkedInProfile data structure"""
@@ -87,6 +96,21 @@ class TestBrowserConfig(unittest.TestCase):
         self.assertGreater(len(user_agent), 10)
         self.assertIn("Mozilla", user_agent)
 
+    def test_stealth_browser_reuses_pooled_driver(self):
+        """Test leaving a StealthBrowser context keeps its driver for the next one"""
+        driver = Mock()
+        with patch.object(stealth_browser, '_browser_pool', stealth_browser._BrowserPool(1)), \
+                patch.object(stealth_browser, 'create_enhanced_browser', return_value=driver) as create:
+            with StealthBrowser() as first:
+                pass
+            with StealthBrowser() as second:
+                pass
+
+        self.assertIs(first, second)
+        self.assertEqual(create.call_count, 1)
+        driver.execute_cdp_cmd.assert_any_call("Network.clearBrowserCookies", {})
+        driver.quit.assert_not_called()
+
 class TestDatabaseStorage(unittest.TestCase):
     """Test database storage functionality"""
     
@@ -135,6 +159,88 @@ class TestDatabaseStorage(unittest.TestCase):
             
         except Exception as e:
             self.skipTest(f"Database operations not available: {e}")
+    
+    def test_get_already_extracted_urls(self):
+        """Test only recently and successfully extracted URLs are reported"""
+        try:
+            storage = LinkedInDatabaseStorage()
+            
+            storage.save_profile(LinkedInProfile(
+                full_name="Recent User",
+                linkedin_url="https://linkedin.com/in/recentuser",
+                extraction_success=True
+            ))
+            storage.save_profile(LinkedInProfile(
+                full_name="Stale User",
+                linkedin_url="https://linkedin.com/in/staleuser",
+                extraction_timestamp="2000-01-01T00:00:00",
+                extraction_success=True
+            ))
+            
+            extracted = storage.get_already_extracted_urls([
+                "https://linkedin.com/in/recentuser",
+                "https://linkedin.com/in/staleuser",
+                "https://linkedin.com/in/unknownuser"
+            ])
+            self.assertEqual(extracted, {"https://linkedin.com/in/recentuser"})
+            
+        except Exception as e:
+            self.skipTest(f"Database operations not available: {e}")
+    
+    def test_get_profile_by_url_returns_fetched_row(self):
+        """Test profile lookup returns the row it fetched instead of fetching again"""
+        cursor = MagicMock()
+        cursor.fetchone.side_effect = [{'full_name': "Test User"}, None]
+        conn = MagicMock()
+        conn.cursor.return_value.__enter__.return_value = cursor
+        
+        storage = LinkedInDatabaseStorage.__new__(LinkedInDatabaseStorage)
+        with patch.object(storage, 'get_db_connection') as get_db_connection, \
+                patch.object(storage, '_execute_prepared'):
+            get_db_connection.return_value.__enter__.return_value = conn
+            retrieved = storage.get_profile_by_url("https://linkedin.com/in/testuser")
+        
+        self.assertEqual(retrieved, {'full_name': "Test User"})
+        self.assertEqual(cursor.fetchone.call_count, 1)
+    
+    def test_closed_at_exit_without_being_kept_alive(self):
+        """Test storages are tracked for exit-time closing without leaking"""
+        with patch.dict(os.environ, {'SKIP_DB_INIT': 'true'}):
+            storage = LinkedInDatabaseStorage()
+        self.assertIn(storage, database_storage._open_storages)
+        
+        storage_ref = weakref.ref(storage)
+        del storage
+        gc.collect()
+        self.assertIsNone(storage_ref())
+    
+    def test_logging_storage_is_not_kept_alive(self):
+        """Test the extraction log writer lets go of its storage once closed or idle"""
+        for close in (True, False):
+            with self.subTest(close=close), \
+                    patch.dict(os.environ, {'SKIP_DB_INIT': 'true'}), \
+                    patch.object(database_storage, 'LOG_WRITER_IDLE_TIMEOUT', 0.05), \
+                    patch.object(LinkedInDatabaseStorage, '_write_extraction_logs') as write:
+                storage = LinkedInDatabaseStorage()
+                storage.log_extraction('bulk', 'urls.txt', 2, 1, 3)
+                storage.flush_logs()
+                log_thread = storage._log_thread
+                if close:
+                    storage.close()
+                log_thread.join(timeout=5)
+                
+                self.assertEqual(write.call_count, 1)
+                storage_ref = weakref.ref(storage)
+                del storage
+                gc.collect()
+                self.assertIsNone(storage_ref())
+    
+    def test_copy_field_escapes(self):
+        """Test COPY text format keeps NULL, empty strings and special characters apart"""
+        self.assertEqual(_copy_field(None), '\\N')
+        self.assertEqual(_copy_field(''), '')
+        self.assertEqual(_copy_field('a\tb\nc\\d'), 'a\\tb\\nc\\\\d')
+        self.assertEqual(_copy_field(True), 'True')
 
 class TestExtractorComponents(unittest.TestCase):
     """Test extractor components without browser"""
@@ -171,6 +277,189 @@ class TestExtractorComponents(unittest.TestCase):
             if expected_type in ["sales_navigator_profile", "sales_navigator_search", "company_page"]:
                 self.assertIn(expected_type.split('_')[0], detected_type)
 
+    def test_add_contacts_skips_duplicates(self):
+        """Test merged contacts keep their order and skip ones already on the profile"""
+        profile = LinkedInProfile(emails=["ann@acme.com"], phones=["555-123-4567"])
+        
+        _add_contacts(profile, {
+            "email": ["ann@acme.com", "bob@acme.com", "bob@acme.com"],
+            "phone": ["555-123-4567", "+44 20 7946 0958"],
+            "website": ["https://acme.com", "https://www.linkedin.com/in/ann"]
+        })
+        
+        self.assertEqual(profile.emails, ["ann@acme.com", "bob@acme.com"])
+        self.assertEqual(profile.phones, ["555-123-4567", "+44 20 7946 0958"])
+        self.assertEqual(profile.websites, ["https://acme.com"])
+
+    def test_scan_contacts_ignores_asset_addresses(self):
+        """Test emails are lowercased and error reporting and asset addresses left out"""
+        found = _scan_contacts("Ann@Acme.com abc123@o45.ingest.sentry.io logo@2x.licdn.com call (555) 123-4567")
+        
+        self.assertEqual(found["email"], ["ann@acme.com"])
+        self.assertEqual(found["phone"], ["(555) 123-4567"])
+
+    def test_sales_navigator_contacts_fall_back_to_full_page(self):
+        """Test an empty contact section does not hide contacts elsewhere on the page"""
+        mock_driver = Mock()
+        mock_driver.execute_script.return_value = "<div class='contact-info'></div>"
+        mock_driver.page_source = "<p>Reach me at ann@acme.com</p>"
+        mock_driver.find_elements.return_value = []
+        extractor = WorkingLinkedInExtractor(mock_driver)
+        profile = LinkedInProfile()
+        
+        extractor._extract_sales_navigator_contact_info(profile)
+        
+        self.assertEqual(profile.emails, ["ann@acme.com"])
+
+    def test_sales_navigator_contacts_without_section_scan_page_once(self):
+        """Test a page without a contact section is fetched and scanned only once"""
+        mock_driver = Mock()
+        mock_driver.execute_script.return_value = ""
+        mock_driver.find_elements.return_value = []
+        page_source = PropertyMock(return_value="<p>Reach me at ann@acme.com</p>")
+        type(mock_driver).page_source = page_source
+        extractor = WorkingLinkedInExtractor(mock_driver)
+        profile = LinkedInProfile()
+        
+        extractor._extract_sales_navigator_contact_info(profile)
+        
+        self.assertEqual(profile.emails, ["ann@acme.com"])
+        self.assertEqual(page_source.call_count, 1)
+    
+    def test_search_results_share_one_timestamp(self):
+        """Test every profile from a search page gets the same extraction timestamp"""
+        mock_driver = Mock()
+        mock_driver.current_url = "https://linkedin.com/sales/search/people"
+        mock_driver.execute_script.return_value = [
+            {"full_name": [["Ann Lee"]], "linkedin_url": [["https://linkedin.com/in/ann"]]},
+            {"full_name": [["Bob Ray"]], "linkedin_url": [["https://linkedin.com/in/bob"]]}
+        ]
+        extractor = WorkingLinkedInExtractor(mock_driver)
+        
+        profiles = extractor.extract_search()
+        
+        self.assertEqual([profile.full_name for profile in profiles], ["Ann Lee", "Bob Ray"])
+        self.assertTrue(profiles[0].extraction_timestamp)
+        self.assertEqual(profiles[0].extraction_timestamp, profiles[1].extraction_timestamp)
+
+    def test_extractors_share_request_pacing(self):
+        """Test throttling seen by one browser slows every extractor hitting that host"""
+        throttled, other = Mock(), Mock()
+        throttled.current_url = "https://www.linkedin.com/checkpoint/challenge"
+        other.current_url = "https://www.linkedin.com/in/bob"
+        
+        with patch.dict(working_linkedin_extractor._pacers, clear=True), \
+                patch.object(working_linkedin_extractor.time, 'sleep') as sleep:
+            WorkingLinkedInExtractor(throttled)._open("https://www.linkedin.com/in/ann")
+            pacer = working_linkedin_extractor._pacer_for("https://www.linkedin.com/in/bob")
+            self.assertEqual(pacer.delay, 2 * working_linkedin_extractor.MIN_REQUEST_DELAY)
+            
+            WorkingLinkedInExtractor(other)._open("https://www.linkedin.com/in/bob")
+        
+        # The second browser waited out the raised delay before loading its page
+        self.assertEqual(sleep.call_count, 1)
+        self.assertGreater(sleep.call_args.args[0], working_linkedin_extractor.MIN_REQUEST_DELAY)
+
+class TestBulkExtraction(unittest.TestCase):
+    """Test bulk URL reading and chunked extraction without a browser"""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Import main without letting it create a log file"""
+        with patch('logging.FileHandler', return_value=logging.NullHandler()):
+            cls.main = importlib.import_module('main')
+    
+    def make_scraper(self, recent=()):
+        """Scraper with one stub extractor whose extractions always succeed"""
+        extractor = Mock()
+        extractor.extract_single.side_effect = lambda url: LinkedInProfile(
+            full_name=url, linkedin_url=url, extraction_success=True
+        )
+        scraper = self.main.LinkedInScraperMain()
+        scraper.extractors = [extractor]
+        scraper.storage = Mock()
+        scraper.storage.get_already_extracted_urls.side_effect = lambda urls, days: set(urls) & set(recent)
+        return scraper
+    
+    def progress(self, scraper, urls):
+        """Extracted URLs and the [i/total] labels logged while extracting them"""
+        with self.assertLogs('main', level='INFO') as logs:
+            extracted = [profile.linkedin_url for profile in scraper.iter_bulk_profiles(urls)]
+        labels = [message.split('] ')[0].split('[')[-1] for message in logs.output if 'Processing:' in message]
+        return extracted, labels
+    
+    def test_iter_urls_from_file_skips_comments_and_repeats(self):
+        """Test URL files keep first-seen order without comments, blanks or repeats"""
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as f:
+            f.write("# exported urls\n"
+                    "https://linkedin.com/in/b\n"
+                    "\n"
+                    "  https://linkedin.com/in/a  \n"
+                    "https://linkedin.com/in/b\n"
+                    "#https://linkedin.com/in/c\n"
+                    "https://linkedin.com/in/c\n")
+        self.addCleanup(os.remove, f.name)
+        
+        self.assertEqual(list(self.main.iter_urls_from_file(f.name)), [
+            "https://linkedin.com/in/b",
+            "https://linkedin.com/in/a",
+            "https://linkedin.com/in/c"
+        ])
+    
+    def test_bulk_numbering_keeps_input_positions(self):
+        """Test URLs skipped as recent don't shift the [i/total] numbering"""
+        urls = [f"https://linkedin.com/in/user{i}" for i in range(1, 6)]
+        scraper = self.make_scraper(recent={urls[1], urls[3]})
+        
+        with patch.object(self.main, 'URL_CHUNK_SIZE', 2):
+            extracted, labels = self.progress(scraper, urls)
+        
+        self.assertEqual(extracted, [urls[0], urls[2], urls[4]])
+        self.assertEqual(labels, ["1/5", "3/5", "5/5"])
+        # Recent extractions are looked up one bounded chunk at a time
+        chunks = [call.args[0] for call in scraper.storage.get_already_extracted_urls.call_args_list]
+        self.assertEqual(chunks, [urls[0:2], urls[2:4], urls[4:5]])
+    
+    def test_bulk_numbering_for_streamed_urls(self):
+        """Test URLs without a length are numbered [i/?]"""
+        urls = [f"https://linkedin.com/in/user{i}" for i in range(1, 4)]
+        scraper = self.make_scraper(recent={urls[0]})
+        
+        with patch.object(self.main, 'URL_CHUNK_SIZE', 2):
+            extracted, labels = self.progress(scraper, iter(urls))
+        
+        self.assertEqual(extracted, urls[1:])
+        self.assertEqual(labels, ["2/?", "3/?"])
+        scraper.storage.save_profiles_bulk.assert_called_once()
+
+class TestSocialPlatforms(unittest.TestCase):
+    """Test the demo and storage social link classifiers agree on the same links"""
+    
+    # (link, demo label, stored contact_platform)
+    CASES = [
+        ("https://twitter.com/jane", "Twitter/X", "twitter"),
+        ("https://x.com/jane", "Twitter/X", "twitter"),
+        ("https://mobile.twitter.com/jane", "Twitter/X", "twitter"),
+        ("twitter.com/jane", "Twitter/X", "twitter"),
+        ("github.com/jane", "GitHub", "github"),
+        ("HTTPS://GitHub.com/Jane", "GitHub", "github"),
+        ("https://www.facebook.com/jane", "Facebook", "facebook"),
+        ("https://www.linkedin.com/in/jane", "Other", "linkedin"),
+        ("https://netflix.com/browse", "Other", None),
+        ("https://linux.com", "Other", None),
+        ("https://github.com.evil.io/jane", "Other", None),
+        ("https://evil.io/github.com", "Other", None),
+        ("https://example.com", "Other", None),
+    ]
+    
+    def test_social_platform_classification(self):
+        """Test platforms come from the link's host only"""
+        demo = ContactExtractionDemo.__new__(ContactExtractionDemo)
+        for url, label, platform in self.CASES:
+            with self.subTest(url=url):
+                self.assertEqual(demo._identify_social_platform(url), label)
+                self.assertEqual(_social_platform(url), platform)
+
 class TestIntegration(unittest.TestCase):
     """Integration tests for full workflow"""
     
@@ -220,6 +509,8 @@ def run_tests():
         TestBrowserConfig,
         TestDatabaseStorage,
         TestExtractorComponents,
+        TestBulkExtraction,
+        TestSocialPlatforms,
         TestIntegration
     ]
     
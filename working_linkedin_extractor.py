@@ -14,19 +14,241 @@ Uses battle-tested selectors from the original kingtroga/linkedin_scraper repo
 import re
 import time
 import logging
-from typing import Dict, List, Optional, Any, Union
+import threading
+from urllib.parse import urlparse
+from typing import Dict, List, Optional, Any, Sequence, Union
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from bs4 import BeautifulSoup
+from selenium.common.exceptions import TimeoutException
 import json
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Contact patterns, compiled once and shared by every extraction
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+# The lookahead lets the scan skip positions that cannot start a number
+_PHONE_RE = re.compile(r'(?=[\d(+])\+?1?[-.\s]?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}')  # Also covers (555) 123-4567
+_INTL_PHONE_RE = re.compile(r'\+[1-9]\d{1,14}')  # International format
+_URL_RE = re.compile(r'https?://(?:[-\w.])+(?:[:\d]+)?(?:/(?:[\w/_.])*(?:\?(?:[\w&=%.])*)?(?:#(?:[\w.])*)?)?', re.IGNORECASE)
+_WWW_RE = re.compile(r'www\.[\w.-]+\.[a-z]{2,}', re.IGNORECASE)
+# Deletes the separators the phone pattern allows, leaving digits and '+'
+# (U+3000 is the highest code point \s matches)
+_PHONE_SEPARATORS = str.maketrans('', '', '().-' + ''.join(
+    char for char in map(chr, range(0x3001)) if char.isspace()))
+
+# Patterns scanned per kind of contact besides email (see _scan_emails). Emails in
+# mailto: links and numbers in (555) 123-4567 form already match the general
+# patterns, so they get no scan of their own; one alternation for everything
+# measured slower than these separate scans, since it loses the regex engine's
+# literal-prefix search
+_CONTACT_PATTERNS = {
+    "phone": (_PHONE_RE, _INTL_PHONE_RE),
+    "website": (_URL_RE, _WWW_RE),
+}
+
+# Addresses that turn up in page scripts and asset URLs rather than in contact details
+_IGNORED_EMAIL_DOMAINS = ("sentry.io", "licdn.com")
+_IGNORED_EMAIL_SUFFIXES = tuple(
+    prefix + domain for domain in _IGNORED_EMAIL_DOMAINS for prefix in ("@", ".")
+)
+
+def _scan_emails(text: str) -> List[str]:
+    """Lowercased emails found in the text, leaving out asset and error-reporting addresses"""
+    return [email for email in map(str.lower, _EMAIL_RE.findall(text))
+            if not email.endswith(_IGNORED_EMAIL_SUFFIXES)]
+
+def _scan_contacts(text: str) -> Dict[str, List[str]]:
+    """Emails, phones (10+ digits) and websites found in the text"""
+    found = {
+        kind: [match.strip() for pattern in patterns for match in pattern.findall(text)]
+        for kind, patterns in _CONTACT_PATTERNS.items()
+    }
+    found["phone"] = [phone for phone in found["phone"] if len(phone.translate(_PHONE_SEPARATORS)) >= 10]
+    found["email"] = _scan_emails(text)
+    return found
+
+def _add_contacts(profile: "LinkedInProfile", found: Dict[str, List[str]]):
+    """Merge scanned contacts into the profile, skipping ones it already has"""
+    # dict.fromkeys dedups in constant time per entry and keeps first-seen order
+    websites = [site for site in found.get("website", []) if 'linkedin.com' not in site]
+    profile.emails = list(dict.fromkeys(profile.emails + found.get("email", [])))
+    profile.phones = list(dict.fromkeys(profile.phones + found.get("phone", [])))
+    profile.websites = list(dict.fromkeys(profile.websites + websites))
+
+# Elements that show a page has rendered what we scrape; with the 'eager' page
+# load strategy driver.get() returns before LinkedIn's scripts have drawn them
+_PROFILE_READY_SELECTOR = ".profile-topcard-person-entity__name, .artdeco-entity-lockup__title, h1.text-heading-xlarge, h1"
+_SEARCH_READY_SELECTOR = ".search-results__result-item, [data-anonymize='person']"
+
+# Contact info modal, and how long (seconds) to wait for it to open or close;
+# it counts as open once its content shows, as the frame can appear first
+_MODAL_SELECTOR = ".artdeco-modal"
+_MODAL_CONTENT_SELECTOR = ".artdeco-modal__content, .pv-contact-info__contact-type"
+MODAL_TIMEOUT = 2
+
+# Parts of a profile page that hold contact details
+_CONTACT_SECTION_SELECTOR = ".pv-contact-info, .contact-info, [data-section='contactInfo'], .contact-see-more-card"
+
+# Adaptive pacing between page loads (seconds): start fast, back off when throttled
+MIN_REQUEST_DELAY = 0.5
+MAX_REQUEST_DELAY = 60.0
+
+class _RequestPacer:
+    """Adaptive delay between page loads from one host, shared by every extractor"""
+    
+    def __init__(self):
+        self.delay = MIN_REQUEST_DELAY
+        self._last_request_at = 0.0
+        self._lock = threading.Lock()
+    
+    def wait(self):
+        """Sleep until this request's turn, spacing requests from all browsers by the delay"""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._last_request_at + self.delay)
+            self._last_request_at = start
+        if start > now:
+            logger.info(f"⏳ Waiting {start - now:.1f} seconds before next request...")
+            time.sleep(start - now)
+    
+    def update(self, throttled: bool):
+        """Double the delay after throttling, ease back towards the minimum otherwise"""
+        with self._lock:
+            # The delay also counts from the end of the page load that just finished
+            self._last_request_at = max(self._last_request_at, time.monotonic())
+            if throttled:
+                self.delay = min(self.delay * 2, MAX_REQUEST_DELAY)
+                logger.warning(f"⚠️ LinkedIn is throttling requests, delay raised to {self.delay:.1f}s")
+            else:
+                self.delay = max(self.delay / 2, MIN_REQUEST_DELAY)
+
+# Host -> pacer, so all extractors in the process back off together
+_pacers: Dict[str, _RequestPacer] = {}
+_pacers_lock = threading.Lock()
+
+def _pacer_for(url: str) -> _RequestPacer:
+    """The shared pacer for the URL's host"""
+    host = (urlparse(url).hostname or "").lower()
+    with _pacers_lock:
+        return _pacers.setdefault(host, _RequestPacer())
+
+# Page type by URL fragment, checked in order; None marks a regular profile,
+# which is authenticated or public depending on what the page shows
+_PAGE_TYPES_BY_URL = (
+    ("/sales/lead/", "sales_navigator_profile"),
+    ("/sales/search/", "sales_navigator_search"),
+    ("/sales/lists/", "sales_navigator_search"),
+    ("/in/", None),
+    ("/company/", "company_page"),
+)
+
+# URL fragments LinkedIn redirects to when rate limiting or challenging a session
+_THROTTLE_URL_MARKERS = ("/checkpoint/", "/authwall", "challenge")
+
+# Reads every match of every fallback selector in a single WebDriver round trip,
+# instead of one find_element plus one .text command per selector tried.
+# Arguments: root selectors (the first that matches anything wins; none means
+# the whole document), a cap on root elements, {field: [text selectors]} and
+# {field: [link selectors]}. Returns one {field: [[values per selector]]} per root.
+_COLLECT_JS = """
+const [rootSelectors, limit, texts, links] = arguments;
+let roots = [document];
+for (const selector of rootSelectors) {
+    roots = Array.from(document.querySelectorAll(selector));
+    if (roots.length) break;
+}
+if (limit) roots = roots.slice(0, limit);
+const collect = (root, fields, read) => Object.fromEntries(Object.entries(fields).map(
+    ([field, selectors]) => [field, selectors.map(s => Array.from(root.querySelectorAll(s), read))]));
+return roots.map(root => Object.assign(
+    collect(root, texts, el => el.innerText.trim()),
+    collect(root, links, el => el.href || "")));
+"""
+
+def _first_match(candidates: List[List[str]], accept=bool) -> str:
+    """First match of the first selector whose first match is non-empty and accepted"""
+    for matches in candidates:
+        if matches and matches[0] and accept(matches[0]):
+            return matches[0]
+    return ""
+
+# Fallback selectors per field, most specific first, in _collect's format
+_SALES_NAVIGATOR_TOP_CARD_SELECTORS = {
+    "full_name": (
+        ".profile-topcard-person-entity__name",
+        ".artdeco-entity-lockup__title",
+        ".profile-topcard__name",
+        "h1"
+    ),
+    "role": (
+        ".profile-topcard-person-entity__title",
+        ".artdeco-entity-lockup__subtitle",
+        ".profile-topcard__occupation"
+    ),
+    "company": (
+        ".profile-topcard-person-entity__company",
+        ".profile-topcard__summary-company"
+    ),
+    "geography": (
+        ".profile-topcard-person-entity__location",
+        ".profile-topcard__summary-location"
+    )
+}
+
+_PROFILE_TOP_CARD_SELECTORS = {
+    "name": (
+        "h1.text-heading-xlarge",
+        ".pv-text-details__left-panel h1",
+        ".ph5.pb5 h1",
+        "h1",
+        ".pv-top-card--list h1"
+    ),
+    "role": (
+        ".text-body-medium.break-words",
+        ".pv-text-details__left-panel .text-body-medium",
+        ".ph5.pb5 .text-body-medium",
+        ".pv-top-card--list .text-body-medium",
+        "div[data-generated-suggestion-target]",
+        ".pv-entity__summary-info"
+    ),
+    "headline": (".pv-text-details__left-panel .text-body-medium",),
+    "company": (".experience-item__title", ".pv-entity__summary-info-v2"),
+    "location": (
+        ".text-body-small.inline.t-black--light.break-words",
+        ".pv-text-details__left-panel .text-body-small",
+        "[data-anonymize='location']"
+    )
+}
+
+# Role candidates containing these are button labels, not job titles
+_ROLE_SKIP_WORDS = ('contact info', 'message', 'connect', 'follow')
+
+_ABOUT_SELECTORS = {"about": (
+    ".pv-about__text",
+    ".summary",
+    "[data-section='summary']",
+    ".pv-about-section .pv-about__text"
+)}
+
+_PROFILE_LINK_SELECTORS = {"linkedin_url": (
+    "a[href*='/in/']",
+    ".profile-topcard-person-entity__name a",
+    "a[data-control-name='view_linkedin']"
+)}
+
+_SEARCH_CARD_ROOTS = (".search-results__result-item", "[data-anonymize='person']")
+_SEARCH_CARD_SELECTORS = {
+    "full_name": (".search-results__result-item__name", ".name", "h3", "h4"),
+    "role": (".search-results__result-item__title", ".title", ".subtitle"),
+    "company": (".search-results__result-item__company", ".company", ".organization"),
+    "geography": (".search-results__result-item__location", ".location", ".geography")
+}
+_SEARCH_CARD_LINK_SELECTORS = {"linkedin_url": ("a",)}
+
 @dataclass
 class LinkedInProfile:
     """Working LinkedIn profile data structure"""
@@ -76,7 +298,16 @@ class LinkedInProfile:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for storage"""
-        return asdict(self)
+        # Fields are flat strings and lists of strings, so a shallow copy of each
+        # list gives the same result as asdict without its recursive deep copy
+        data = {}
+        for name in _PROFILE_FIELDS:
+            value = getattr(self, name)
+            data[name] = list(value) if isinstance(value, list) else value
+        return data
+
+# Field names in declaration order, looked up once for to_dict
+_PROFILE_FIELDS = tuple(field.name for field in fields(LinkedInProfile))
 
 class WorkingLinkedInExtractor:
     """Working LinkedIn extractor using proven selectors"""
@@ -84,26 +315,66 @@ class WorkingLinkedInExtractor:
     def __init__(self, driver: webdriver.Chrome, wait_timeout: int = 10):
         self.driver = driver
         self.wait = WebDriverWait(driver, wait_timeout)
+        self._modal_wait = WebDriverWait(driver, MODAL_TIMEOUT)
+    
+    def is_throttled(self) -> bool:
+        """Check whether LinkedIn sent us to a rate-limit or verification page"""
+        current_url = self.driver.current_url
+        return any(marker in current_url for marker in _THROTTLE_URL_MARKERS)
+    
+    def _wait_for(self, selector: str) -> bool:
+        """Wait until an element matches the selector or LinkedIn throttles us"""
+        try:
+            self.wait.until(lambda driver: self.is_throttled() or driver.find_elements(By.CSS_SELECTOR, selector))
+            return True
+        except TimeoutException:
+            logger.debug(f"Timed out waiting for {selector}")
+            return False
+    
+    def _wait_for_modal(self, visible: bool = True) -> bool:
+        """Wait briefly for the contact modal to open (or to close)"""
+        if visible:
+            condition = EC.visibility_of_element_located((By.CSS_SELECTOR, _MODAL_CONTENT_SELECTOR))
+        else:
+            condition = EC.invisibility_of_element_located((By.CSS_SELECTOR, _MODAL_SELECTOR))
+        try:
+            self._modal_wait.until(condition)
+            return True
+        except TimeoutException:
+            logger.debug(f"Contact modal did not {'open' if visible else 'close'} in {MODAL_TIMEOUT}s")
+            return False
+    
+    def _section_source(self, selector: str, fallback: bool = True) -> str:
+        """HTML of the elements matching the selector
+        
+        When none match this is the whole page, or '' if fallback is False.
+        """
+        # Serialising a few elements is far cheaper than page_source on a full
+        # profile, and keeps script bundles and stylesheets out of the scan
+        html = self.driver.execute_script(
+            "return Array.from(document.querySelectorAll(arguments[0]), element => element.outerHTML).join('\\n');",
+            selector)
+        if html or not fallback:
+            return html or ""
+        return self.driver.page_source
+    
+    def _collect(self, texts: Dict[str, Sequence[str]], links: Dict[str, Sequence[str]] = None,
+                 roots: Sequence[str] = None, limit: int = None) -> List[Dict[str, List[List[str]]]]:
+        """Read the matches of many selectors at once (see _COLLECT_JS)"""
+        return self.driver.execute_script(_COLLECT_JS, roots or [], limit, texts, links or {})
         
     def detect_page_type(self) -> str:
         """Detect the type of LinkedIn page we're on"""
         current_url = self.driver.current_url
+        page_type = next((kind for fragment, kind in _PAGE_TYPES_BY_URL if fragment in current_url), "unknown")
+        if page_type is not None:
+            return page_type
         
-        if "/sales/lead/" in current_url:
-            return "sales_navigator_profile"
-        elif "/sales/search/" in current_url or "/sales/lists/" in current_url:
-            return "sales_navigator_search"
-        elif "/in/" in current_url:
-            # Check if we're logged in (authenticated profile vs public)
-            try:
-                self.driver.find_element(By.CSS_SELECTOR, ".pv-text-details__right-panel")
-                return "authenticated_profile"
-            except NoSuchElementException:
-                return "public_profile"
-        elif "/company/" in current_url:
-            return "company_page"
-        else:
-            return "unknown"
+        # Check if we're logged in (authenticated profile vs public); find_elements
+        # returns an empty list instead of raising when the panel is missing
+        if self.driver.find_elements(By.CSS_SELECTOR, ".pv-text-details__right-panel"):
+            return "authenticated_profile"
+        return "public_profile"
     
     def extract_sales_navigator_profile(self) -> LinkedInProfile:
         """Extract from Sales Navigator profile page using proven selectors"""
@@ -114,75 +385,14 @@ class WorkingLinkedInExtractor:
         try:
             logger.info("🎯 Extracting Sales Navigator profile...")
             
-            # Wait for page to load
-            time.sleep(3)
-            
-            # Extract basic profile info using original selectors
-            page_source = self.driver.page_source
-            soup = BeautifulSoup(page_source, 'html.parser')
-            
-            # Name - try multiple selectors from original repo
-            name_selectors = [
-                ".profile-topcard-person-entity__name",
-                ".artdeco-entity-lockup__title",
-                ".profile-topcard__name",
-                "h1"
-            ]
-            
-            for selector in name_selectors:
-                try:
-                    name_elem = soup.select_one(selector)
-                    if name_elem and name_elem.get_text(strip=True):
-                        profile.full_name = name_elem.get_text(strip=True)
-                        break
-                except:
-                    continue
-            
-            # Role/Title
-            role_selectors = [
-                ".profile-topcard-person-entity__title",
-                ".artdeco-entity-lockup__subtitle",
-                ".profile-topcard__occupation"
-            ]
-            
-            for selector in role_selectors:
-                try:
-                    role_elem = soup.select_one(selector)
-                    if role_elem and role_elem.get_text(strip=True):
-                        profile.role = role_elem.get_text(strip=True)
-                        break
-                except:
-                    continue
-            
-            # Company
-            company_selectors = [
-                ".profile-topcard-person-entity__company",
-                ".profile-topcard__summary-company"
-            ]
-            
-            for selector in company_selectors:
-                try:
-                    company_elem = soup.select_one(selector)
-                    if company_elem and company_elem.get_text(strip=True):
-                        profile.company = company_elem.get_text(strip=True)
-                        break
-                except:
-                    continue
-            
-            # Location/Geography
-            location_selectors = [
-                ".profile-topcard-person-entity__location",
-                ".profile-topcard__summary-location"
-            ]
-            
-            for selector in location_selectors:
-                try:
-                    location_elem = soup.select_one(selector)
-                    if location_elem and location_elem.get_text(strip=True):
-                        profile.geography = location_elem.get_text(strip=True)
-                        break
-                except:
-                    continue
+            # Wait for the top card to render
+            self._wait_for(_PROFILE_READY_SELECTOR)
+            
+            # Top card fields with the original repo's fallback selectors, read in one call
+            found = self._collect(_SALES_NAVIGATOR_TOP_CARD_SELECTORS)[0]
+            
+            for field, candidates in found.items():
+                setattr(profile, field, _first_match(candidates))
             
             # Extract contact information (based on original contact_info.py)
             self._extract_sales_navigator_contact_info(profile)
@@ -203,8 +413,11 @@ class WorkingLinkedInExtractor:
         
         return profile
     
-    def extract_regular_profile(self) -> LinkedInProfile:
-        """Extract from regular LinkedIn profile using enhanced selectors"""
+    def extract_regular_profile(self, page_type: str = None) -> LinkedInProfile:
+        """Extract from regular LinkedIn profile using enhanced selectors
+        
+        Pass the page type when it is already known to skip detecting it again.
+        """
         profile = LinkedInProfile()
         profile.linkedin_url = self.driver.current_url
         
@@ -212,99 +425,33 @@ class WorkingLinkedInExtractor:
             logger.info("👤 Extracting regular LinkedIn profile...")
             
             # Determine if authenticated or public
-            profile.profile_type = self.detect_page_type()
-            
-            # Wait for page to load
-            time.sleep(3)
-            
-            # Name - multiple selectors for reliability
-            name_selectors = [
-                "h1.text-heading-xlarge",
-                ".pv-text-details__left-panel h1",
-                ".ph5.pb5 h1",
-                "h1",
-                ".pv-top-card--list h1"
-            ]
-            
-            for selector in name_selectors:
-                try:
-                    name_elem = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    if name_elem.text.strip():
-                        profile.full_name = name_elem.text.strip()
-                        break
-                except NoSuchElementException:
-                    continue
-            
-            # Enhanced title/role extraction with better logic
-            role_found = False
-            role_selectors = [
-                ".text-body-medium.break-words",
-                ".pv-text-details__left-panel .text-body-medium", 
-                ".ph5.pb5 .text-body-medium",
-                ".pv-top-card--list .text-body-medium",
-                "div[data-generated-suggestion-target]",
-                ".pv-entity__summary-info"
-            ]
-            
-            for selector in role_selectors:
-                if role_found:
-                    break
-                try:
-                    role_elems = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for elem in role_elems:
-                        text = elem.text.strip()
-                        if text and not any(skip in text.lower() for skip in ['contact info', 'message', 'connect', 'follow']):
-                            if len(text) > 10 and len(text) < 200:  # Reasonable role length
-                                profile.role = text
-                                role_found = True
-                                break
-                except NoSuchElementException:
-                    continue
-            
-            # Company extraction
-            company_selectors = [
-                ".pv-text-details__left-panel .text-body-medium:contains('at')",
-                ".experience-item__title",
-                ".pv-entity__summary-info-v2"
-            ]
-            
-            for selector in company_selectors:
-                try:
-                    if "contains" in selector:
-                        # Use BeautifulSoup for text content search
-                        soup = BeautifulSoup(self.driver.page_source, 'html.parser')
-                        elems = soup.select(".pv-text-details__left-panel .text-body-medium")
-                        for elem in elems:
-                            text = elem.get_text(strip=True)
-                            if " at " in text:
-                                company_part = text.split(" at ")[-1]
-                                if company_part and len(company_part) < 100:
-                                    profile.company = company_part
-                                    break
-                    else:
-                        elem = self.driver.find_element(By.CSS_SELECTOR, selector)
-                        if elem.text.strip():
-                            profile.company = elem.text.strip()
-                            break
-                except:
-                    continue
-            
-            # Location
-            location_selectors = [
-                ".text-body-small.inline.t-black--light.break-words",
-                ".pv-text-details__left-panel .text-body-small",
-                "[data-anonymize='location']"
-            ]
-            
-            for selector in location_selectors:
-                try:
-                    elem = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    text = elem.text.strip()
-                    if text and len(text) < 100:  # Reasonable location length
-                        profile.location = text
+            profile.profile_type = page_type or self.detect_page_type()
+            
+            # Wait for the top card to render
+            self._wait_for(_PROFILE_READY_SELECTOR)
+            
+            # Every top card field with its fallback selectors, read in one call
+            found = self._collect(_PROFILE_TOP_CARD_SELECTORS)[0]
+            
+            profile.full_name = _first_match(found["name"])
+            
+            # Role: the first reasonably sized text that is not a button label
+            profile.role = next((
+                text for matches in found["role"] for text in matches
+                if not any(skip in text.lower() for skip in _ROLE_SKIP_WORDS)
+                and 10 < len(text) < 200
+            ), "")
+            
+            # Company: "... at Company" in the headline, unless an experience entry names one
+            for matches in found["headline"]:
+                for text in matches:
+                    company_part = text.split(" at ")[-1] if " at " in text else ""
+                    if company_part and len(company_part) < 100:
+                        profile.company = company_part
                         break
-                except NoSuchElementException:
-                    continue
+            profile.company = _first_match(found["company"]) or profile.company
+            
+            profile.location = _first_match(found["location"], lambda text: len(text) < 100)
             
             # About section
             self._extract_about_section(profile)
@@ -328,56 +475,15 @@ class WorkingLinkedInExtractor:
         try:
             logger.info("📞 Extracting Sales Navigator contact information...")
             
-            # Wait for any contact modal or info to load
-            time.sleep(2)
-            
-            # Try to click contact info button if available
-            contact_selectors = [
-                "button[data-control-name='contact_see_more']",
-                ".contact-see-more-card",
-                "[data-anonymize='phone']",
-                "[data-anonymize='email']"
-            ]
-            
-            page_source = self.driver.page_source
-            
-            # Extract emails using regex patterns
-            email_patterns = [
-                r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b',
-                r'mailto:([A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,})'
-            ]
-            
-            for pattern in email_patterns:
-                emails = re.findall(pattern, page_source, re.IGNORECASE)
-                for email in emails:
-                    if email not in profile.emails and '@' in email:
-                        profile.emails.append(email.lower())
-            
-            # Extract phone numbers using regex
-            phone_patterns = [
-                r'\+?1?[-.\s]?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}',
-                r'\+[1-9]\d{1,14}',  # International format
-                r'\([0-9]{3}\)\s?[0-9]{3}-[0-9]{4}'  # US format with parentheses
-            ]
-            
-            for pattern in phone_patterns:
-                phones = re.findall(pattern, page_source)
-                for phone in phones:
-                    cleaned_phone = re.sub(r'[^\d+]', '', phone)
-                    if len(cleaned_phone) >= 10 and cleaned_phone not in profile.phones:
-                        profile.phones.append(phone)
-            
-            # Extract websites
-            url_patterns = [
-                r'https?://(?:[-\w.])+(?:[:\d]+)?(?:/(?:[\w/_.])*(?:\?(?:[\w&=%.])*)?(?:#(?:[\w.])*)?)?',
-                r'www\.[\w.-]+\.[a-z]{2,}'
-            ]
-            
-            for pattern in url_patterns:
-                websites = re.findall(pattern, page_source, re.IGNORECASE)
-                for website in websites:
-                    if website not in profile.websites and 'linkedin.com' not in website:
-                        profile.websites.append(website)
+            # Emails, phones and websites from a single scan of the contact section;
+            # the whole page is scanned instead when there is no section or it
+            # holds none of them
+            section = self._section_source(_CONTACT_SECTION_SELECTOR, fallback=False)
+            found = _scan_contacts(section) if section else {}
+            if not any(found.values()):
+                found = _scan_contacts(self.driver.page_source)
+            
+            _add_contacts(profile, found)
             
             # Try to extract from contact modals (if accessible)
             try:
@@ -385,22 +491,19 @@ class WorkingLinkedInExtractor:
                 for button in contact_buttons[:2]:  # Limit to first 2 to avoid spam
                     try:
                         button.click()
-                        time.sleep(1)
+                        self._wait_for_modal()
                         
                         # Look for contact info in modal
-                        modal_content = self.driver.page_source
+                        modal_content = self._section_source(_MODAL_SELECTOR)
                         
                         # Extract from modal
-                        modal_emails = re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', modal_content)
-                        for email in modal_emails:
-                            if email not in profile.emails:
-                                profile.emails.append(email.lower())
+                        _add_contacts(profile, {"email": _scan_emails(modal_content)})
                         
                         # Close modal
                         try:
                             close_button = self.driver.find_element(By.CSS_SELECTOR, "button[aria-label='Close'], .artdeco-modal__dismiss")
                             close_button.click()
-                            time.sleep(0.5)
+                            self._wait_for_modal(visible=False)
                         except:
                             pass
                             
@@ -421,44 +524,26 @@ class WorkingLinkedInExtractor:
         try:
             logger.info("📞 Extracting contact information...")
             
-            # Try to find contact info section
-            contact_sections = [
-                ".pv-contact-info",
-                ".contact-info",
-                "[data-section='contactInfo']"
-            ]
-            
             # Look for contact info button and click it
-            try:
-                contact_button = self.driver.find_element(By.CSS_SELECTOR, "a[data-control-name='contact_see_more']")
-                contact_button.click()
-                time.sleep(2)
-                
-                # Extract from contact modal
-                page_source = self.driver.page_source
-                
-                # Extract emails
-                emails = re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', page_source)
-                profile.emails.extend([email.lower() for email in emails if email not in profile.emails])
-                
-                # Extract phones
-                phones = re.findall(r'\+?1?[-.\s]?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}', page_source)
-                profile.phones.extend([phone for phone in phones if phone not in profile.phones])
-                
-                # Extract websites
-                websites = re.findall(r'https?://(?:[-\w.])+(?:[:\d]+)?(?:/(?:[\w/_.])*(?:\?(?:[\w&=%.])*)?(?:#(?:[\w.])*)?)?', page_source)
-                profile.websites.extend([site for site in websites if site not in profile.websites and 'linkedin.com' not in site])
-                
-                # Close modal
-                try:
-                    close_button = self.driver.find_element(By.CSS_SELECTOR, "button[aria-label='Dismiss'], .artdeco-modal__dismiss")
-                    close_button.click()
-                    time.sleep(1)
-                except:
-                    pass
-                    
-            except NoSuchElementException:
+            contact_buttons = self.driver.find_elements(By.CSS_SELECTOR, "a[data-control-name='contact_see_more']")
+            if not contact_buttons:
                 logger.debug("No contact info button found")
+                return
+            
+            contact_buttons[0].click()
+            self._wait_for_modal()
+            
+            # Extract from contact modal in a single scan
+            found = _scan_contacts(self._section_source(_MODAL_SELECTOR))
+            _add_contacts(profile, found)
+            
+            # Close modal
+            try:
+                close_button = self.driver.find_element(By.CSS_SELECTOR, "button[aria-label='Dismiss'], .artdeco-modal__dismiss")
+                close_button.click()
+                self._wait_for_modal(visible=False)
+            except:
+                pass
                 
         except Exception as e:
             logger.error(f"❌ Error extracting contact info: {e}")
@@ -466,22 +551,12 @@ class WorkingLinkedInExtractor:
     def _extract_about_section(self, profile: LinkedInProfile):
         """Extract About/Summary section"""
         try:
-            about_selectors = [
-                ".pv-about__text",
-                ".summary",
-                "[data-section='summary']",
-                ".pv-about-section .pv-about__text"
-            ]
-            
-            for selector in about_selectors:
-                try:
-                    about_elem = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    about_text = about_elem.text.strip()
-                    if about_text and len(about_text) > 20:  # Meaningful about section
-                        profile.about = about_text
-                        break
-                except NoSuchElementException:
-                    continue
+            found = self._collect(_ABOUT_SELECTORS)[0]
+            
+            # Only a meaningful about section counts
+            about_text = _first_match(found["about"], lambda text: len(text) > 20)
+            if about_text:
+                profile.about = about_text
                     
         except Exception as e:
             logger.debug(f"Could not extract about section: {e}")
@@ -490,21 +565,11 @@ class WorkingLinkedInExtractor:
         """Extract the actual LinkedIn profile URL from Sales Navigator"""
         try:
             # Look for LinkedIn profile link in Sales Navigator
-            profile_link_selectors = [
-                "a[href*='/in/']",
-                ".profile-topcard-person-entity__name a",
-                "a[data-control-name='view_linkedin']"
-            ]
-            
-            for selector in profile_link_selectors:
-                try:
-                    link_elem = self.driver.find_element(By.CSS_SELECTOR, selector)
-                    href = link_elem.get_attribute('href')
-                    if href and '/in/' in href:
-                        profile.linkedin_url = href
-                        break
-                except NoSuchElementException:
-                    continue
+            found = self._collect({}, _PROFILE_LINK_SELECTORS)[0]
+            
+            href = _first_match(found["linkedin_url"], lambda href: '/in/' in href)
+            if href:
+                profile.linkedin_url = href
                     
         except Exception as e:
             logger.debug(f"Could not extract LinkedIn profile URL: {e}")
@@ -517,84 +582,27 @@ class WorkingLinkedInExtractor:
             logger.info("🔍 Extracting Sales Navigator search results...")
             
             # Wait for search results to load
-            time.sleep(5)
-            
-            # Find all profile cards in search results
-            profile_cards = self.driver.find_elements(By.CSS_SELECTOR, ".search-results__result-item")
-            
-            if not profile_cards:
-                # Try alternative selector
-                profile_cards = self.driver.find_elements(By.CSS_SELECTOR, "[data-anonymize='person']")
-            
-            logger.info(f"Found {len(profile_cards)} profile cards")
-            
-            for i, card in enumerate(profile_cards[:10]):  # Limit to first 10 for testing
-                try:
-                    profile = LinkedInProfile()
-                    profile.profile_type = "sales_navigator_search"
-                    
-                    # Extract name
-                    name_selectors = [".search-results__result-item__name", ".name", "h3", "h4"]
-                    for selector in name_selectors:
-                        try:
-                            name_elem = card.find_element(By.CSS_SELECTOR, selector)
-                            if name_elem.text.strip():
-                                profile.full_name = name_elem.text.strip()
-                                break
-                        except NoSuchElementException:
-                            continue
-                    
-                    # Extract role
-                    role_selectors = [".search-results__result-item__title", ".title", ".subtitle"]
-                    for selector in role_selectors:
-                        try:
-                            role_elem = card.find_element(By.CSS_SELECTOR, selector)
-                            if role_elem.text.strip():
-                                profile.role = role_elem.text.strip()
-                                break
-                        except NoSuchElementException:
-                            continue
-                    
-                    # Extract company
-                    company_selectors = [".search-results__result-item__company", ".company", ".organization"]
-                    for selector in company_selectors:
-                        try:
-                            company_elem = card.find_element(By.CSS_SELECTOR, selector)
-                            if company_elem.text.strip():
-                                profile.company = company_elem.text.strip()
-                                break
-                        except NoSuchElementException:
-                            continue
-                    
-                    # Extract location
-                    location_selectors = [".search-results__result-item__location", ".location", ".geography"]
-                    for selector in location_selectors:
-                        try:
-                            location_elem = card.find_element(By.CSS_SELECTOR, selector)
-                            if location_elem.text.strip():
-                                profile.geography = location_elem.text.strip()
-                                break
-                        except NoSuchElementException:
-                            continue
-                    
-                    # Try to get profile URL
-                    try:
-                        profile_link = card.find_element(By.CSS_SELECTOR, "a")
-                        href = profile_link.get_attribute('href')
-                        if href:
-                            profile.linkedin_url = href
-                    except NoSuchElementException:
-                        pass
-                    
-                    profile.extraction_success = bool(profile.full_name)
-                    
-                    if profile.extraction_success:
-                        profiles.append(profile)
-                        logger.info(f"✅ Extracted: {profile.full_name} - {profile.company}")
-                    
-                except Exception as e:
-                    logger.error(f"❌ Error extracting profile {i+1}: {e}")
-                    continue
+            self._wait_for(_SEARCH_READY_SELECTOR)
+            
+            # Read the first 10 profile cards (limited for testing) in one call
+            cards = self._collect(_SEARCH_CARD_SELECTORS, _SEARCH_CARD_LINK_SELECTORS,
+                                  roots=_SEARCH_CARD_ROOTS, limit=10)
+            
+            logger.info(f"Found {len(cards)} profile cards")
+            
+            # One pre-formatted timestamp for every profile on this page
+            timestamp = datetime.utcnow().isoformat()
+            for found in cards:
+                profile = LinkedInProfile(
+                    profile_type="sales_navigator_search",
+                    extraction_timestamp=timestamp,
+                    **{field: _first_match(candidates) for field, candidates in found.items()}
+                )
+                profile.extraction_success = bool(profile.full_name)
+                
+                if profile.extraction_success:
+                    profiles.append(profile)
+                    logger.info(f"✅ Extracted: {profile.full_name} - {profile.company}")
             
             logger.info(f"✅ Successfully extracted {len(profiles)} profiles from search results")
             
@@ -603,26 +611,59 @@ class WorkingLinkedInExtractor:
         
         return profiles
     
+    def _open(self, url: str):
+        """Load a page, pacing requests to its host and adapting the delay to throttling"""
+        pacer = _pacer_for(url)
+        pacer.wait()
+        self.driver.get(url)
+        self._wait_for(f"{_PROFILE_READY_SELECTOR}, {_SEARCH_READY_SELECTOR}")
+        pacer.update(self.is_throttled())
+    
+    def _extract_single(self, page_type: str) -> LinkedInProfile:
+        """Extract the profile on the current page"""
+        if page_type == "sales_navigator_profile":
+            return self.extract_sales_navigator_profile()
+        if page_type in ["authenticated_profile", "public_profile"]:
+            return self.extract_regular_profile(page_type)
+        
+        logger.error(f"Unsupported page type: {page_type}")
+        return LinkedInProfile()
+    
+    def _extract_search(self, page_type: str) -> List[LinkedInProfile]:
+        """Extract the profiles listed on the current search page"""
+        if page_type != "sales_navigator_search":
+            logger.error(f"Not a Sales Navigator search page: {page_type}")
+            return []
+        
+        return self.extract_sales_navigator_search_results()
+    
+    def extract_single(self, url: str = None) -> LinkedInProfile:
+        """Extract a profile page (an unsuccessful, empty profile for other pages)"""
+        if url:
+            self._open(url)
+        return self._extract_single(self.detect_page_type())
+    
+    def extract_search(self, url: str = None) -> List[LinkedInProfile]:
+        """Extract a Sales Navigator search page (an empty list for other pages)"""
+        if url:
+            self._open(url)
+        return self._extract_search(self.detect_page_type())
+    
     def extract_profile(self, url: str = None) -> Union[LinkedInProfile, List[LinkedInProfile]]:
-        """Main extraction method - detects page type and extracts accordingly"""
+        """Main extraction method - detects page type and extracts accordingly
+        
+        Prefer extract_single or extract_search when the kind of page is known.
+        """
         if url:
-            self.driver.get(url)
-            time.sleep(3)
+            self._open(url)
         
         page_type = self.detect_page_type()
-        
-        if page_type == "sales_navigator_profile":
-            return self.extract_sales_navigator_profile()
-        elif page_type == "sales_navigator_search":
-            return self.extract_sales_navigator_search_results()
-        elif page_type in ["authenticated_profile", "public_profile"]:
-            return self.extract_regular_profile()
-        else:
-            logger.error(f"Unsupported page type: {page_type}")
-            return LinkedInProfile()
+        if page_type == "sales_navigator_search":
+            return self._extract_search(page_type)
+        return self._extract_single(page_type)
 
 # Backwards compatibility function
 def extract_linkedin_profile(driver: webdriver.Chrome, url: str = None) -> Union[LinkedInProfile, List[LinkedInProfile]]:
     """Backwards compatibility wrapper"""
     extractor = WorkingLinkedInExtractor(driver)
-    return extractor.extract_profile(url)
\ No newline at end of file
+    return extractor.extract_profile(url)